@@ -56,16 +56,15 @@ class NatalAspects:
 
         active_points_list = get_active_points_list(self.user, self.settings, self.active_points)
 
-        # ---> TODO: Clean this up
-        filtered_settings = []
-        for a in self.aspects_settings:
-            for aspect in self.active_aspects:
-                if a["name"] == aspect["name"]:
-                    a["orb"] = aspect["orb"]  # Assign the aspect's orb
-                    filtered_settings.append(a)
-                    break  # Exit the inner loop once a match is found
-        self.aspects_settings = filtered_settings
-        # <--- TODO: Clean this up
+        # Orb of each active aspect, applied to copies so the shared settings are left untouched
+        active_orbs = {}
+        for aspect in self.active_aspects:
+            active_orbs.setdefault(aspect["name"], aspect["orb"])
+        self.aspects_settings = [
+            a.model_copy(update={"orb": active_orbs[a["name"]]})
+            for a in self.aspects_settings
+            if a["name"] in active_orbs
+        ]
 
         self.all_aspects_list = []
         for first in range(len(active_points_list)):
@@ -127,29 +126,15 @@ class NatalAspects:
         """
 
         logging.debug("Relevant aspects not already calculated, calculating now...")
-        self.all_aspects
 
-        axes_list = AXES_LIST
-        counter = 0
-
-        # Remove aspects where the orbits exceed the maximum orb thresholds specified in the settings
-        # (specified usually in kr.config.json file)
-        aspects_filtered = self.all_aspects
-        aspects_list_subtract = []
-        for a in aspects_filtered:
-            counter += 1
-            name_p1 = str(a["p1_name"])
-            name_p2 = str(a["p2_name"])
-
-            if name_p1 in axes_list:
-                if abs(a["orbit"]) >= self.axes_orbit_settings:
-                    aspects_list_subtract.append(a)
-
-            elif name_p2 in axes_list:
-                if abs(a["orbit"]) >= self.axes_orbit_settings:
-                    aspects_list_subtract.append(a)
-
-        self.aspects = [item for item in aspects_filtered if item not in aspects_list_subtract]
+        # Remove aspects involving an axis where the orbit exceeds the maximum orb threshold specified
+        # in the settings (specified usually in kr.config.json file), in a single pass over the aspects
+        # rather than collecting them and scanning that list for every aspect.
+        axes_orbit = self.axes_orbit_settings
+        self.aspects = [
+            a for a in self.all_aspects
+            if not ((a["p1_name"] in AXES_LIST or a["p2_name"] in AXES_LIST) and abs(a["orbit"]) >= axes_orbit)
+        ]
 
         return self.aspects
 
@@ -64,15 +64,15 @@ class SynastryAspects(NatalAspects):
         first_active_points_list = get_active_points_list(self.first_user, self.settings, self.active_points)
         second_active_points_list = get_active_points_list(self.second_user, self.settings, self.active_points)
 
-        # ---> TODO: Clean this up
-        filtered_settings = []
-        for a in self.aspects_settings:
-            for aspect in self.active_aspects:
-                if a["name"] == aspect["name"]:
-                    a["orb"] = aspect["orb"]  # Assign the aspect's orb
-                    filtered_settings.append(a)
-        self.aspects_settings = filtered_settings
-        # <--- TODO: Clean this up
+        # Orb of each active aspect, applied to copies so the shared settings are left untouched
+        active_orbs = {}
+        for aspect in self.active_aspects:
+            active_orbs.setdefault(aspect["name"], aspect["orb"])
+        self.aspects_settings = [
+            a.model_copy(update={"orb": active_orbs[a["name"]]})
+            for a in self.aspects_settings
+            if a["name"] in active_orbs
+        ]
 
         self.all_aspects_list = []
         for first in range(len(first_active_points_list)):
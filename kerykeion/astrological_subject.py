@@ -179,6 +179,9 @@ class AstrologicalSubject:
 
     lunar_phase: LunarPhaseModel
 
+    # Pydantic model of the subject, built by model() on first use
+    _model: Union[AstrologicalSubjectModel, None] = None
+
     def __init__(
         self,
         name="Now",
@@ -408,6 +411,11 @@ class AstrologicalSubject:
     def __repr__(self) -> str:
         return f"Astrological data for: {self.name}, {self.iso_formatted_utc_datetime} UTC\nBirth location: {self.city}, Lat {self.lat}, Lon {self.lng}"
 
+    def __setattr__(self, name, value):
+        # Setting any attribute makes the model built by model() stale
+        self.__dict__.pop("_model", None)
+        super().__setattr__(name, value)
+
     def __getitem__(self, item):
         return getattr(self, item)
 
@@ -700,9 +708,15 @@ class AstrologicalSubject:
     def model(self) -> AstrologicalSubjectModel:
         """
         Creates a Pydantic model of the Kerykeion object.
+        The model is built on the first call and reused until an attribute of the subject is set.
+        It is shared between callers: copy it with model_copy() before changing it.
         """
+        model = self._model
+        if model is None:
+            model = AstrologicalSubjectModel(**self.__dict__)
+            self.__dict__["_model"] = model
 
-        return AstrologicalSubjectModel(**self.__dict__)
+        return model
 
     @cached_property
     def utc_time(self) -> float:
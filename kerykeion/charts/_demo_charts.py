@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+    Worker of the demo charts rendered when running kerykeion_chart_svg as a script.
+    It lives in its own module so that worker processes can import it, the library never does.
+"""
+
+from kerykeion.astrological_subject import AstrologicalSubject
+from kerykeion.composite_subject_factory import CompositeSubjectFactory
+from kerykeion.charts.kerykeion_chart_svg import KerykeionChartSVG
+
+
+def render_demo_chart(job: tuple) -> None:
+    """
+    Build and save one chart of the demo.
+
+    Jobs only carry subject and chart arguments, so they are cheap to send to a worker
+    process, which builds the subjects itself.
+    """
+    (first_args, first_kwargs), chart_type, second, chart_kwargs, render, render_kwargs = job
+
+    first_obj = AstrologicalSubject(*first_args, **first_kwargs)
+    second_obj = None if second is None else AstrologicalSubject(*second[0], **second[1])
+
+    if chart_type == "Composite":
+        assert second_obj is not None, "Composite demo charts need a second subject"
+        first_obj = CompositeSubjectFactory(first_obj, second_obj).get_midpoint_composite_subject_model()
+        second_obj = None
+
+    chart = KerykeionChartSVG(first_obj, chart_type, second_obj, **chart_kwargs)
+    getattr(chart, render)(**render_kwargs)
@@ -3,4 +3,4 @@
 """
 
 from .base_chart_template_builder import BaseChartTemplateBuilder
-from .template_builder_factory import create_template_builder
+from .template_builder_factory import create_template_builder, build_templates_batch
@@ -3,7 +3,9 @@
     This is part of Kerykeion (C) 2025 Giacomo Battaglia
 """
 
-from typing import Optional, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Any, Dict, List
+from .base_chart_template_builder import BaseChartTemplateBuilder
 
 def create_template_builder(chart_svg: Any):
     """
@@ -15,8 +17,29 @@ def create_template_builder(chart_svg: Any):
     Returns:
         BaseChartTemplateBuilder: The appropriate template builder instance
     """
-    from .base_chart_template_builder import BaseChartTemplateBuilder
-    
     # For now, just return the base builder
     # In future versions, specialized builders could be created for each chart type
     return BaseChartTemplateBuilder(chart_svg)
+
+
+def build_templates_batch(chart_svgs: List[Any], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Build the template dictionaries of several charts in parallel processes.
+
+    Template building is CPU bound and each chart is independent, so the work
+    is spread over a process pool. The chart instances must be picklable.
+
+    Args:
+        chart_svgs: KerykeionChartSVG instances
+        max_workers: Maximum number of worker processes (default: number of CPUs)
+
+    Returns:
+        list: The template dictionaries, in the same order as chart_svgs
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_build_template_dictionary, chart_svgs))
+
+
+def _build_template_dictionary(chart_svg: Any) -> Dict[str, Any]:
+    """Build the template dictionary of a single chart, run inside a worker process."""
+    return create_template_builder(chart_svg).build_template_dictionary()
@@ -6,21 +6,46 @@
     It allows using the new input classes while maintaining compatibility with the existing implementation.
 """
 
-from typing import Union, Dict, Any, Optional
-from pathlib import Path
+from typing import Dict, Any, Optional, Callable
 
 # Import the input classes
-from kerykeion.charts.charts_inputs import (
-    ChartInput, 
-    NatalChartInput,
-    ExternalNatalChartInput,
-    SynastryChartInput, 
-    TransitChartInput,
-    CompositeChartInput
-)
+from kerykeion.charts.charts_inputs import ChartInput, ChartInputFactory
 from kerykeion.charts.kerykeion_chart_svg import KerykeionChartSVG
 
 
+# How to build the chart for each chart type tag, given the renamed config kwargs
+_BUILDERS: Dict[str, Callable[[Any, Dict[str, Any]], KerykeionChartSVG]] = {
+    "Natal": lambda ci, cfg: KerykeionChartSVG(
+        first_obj=ci.subject,
+        chart_type="Natal",
+        **cfg
+    ),
+    "ExternalNatal": lambda ci, cfg: KerykeionChartSVG(
+        first_obj=ci.primary_subject,
+        chart_type="ExternalNatal",
+        second_obj=ci.external_subject,
+        **cfg
+    ),
+    "Synastry": lambda ci, cfg: KerykeionChartSVG(
+        first_obj=ci.subject1,
+        chart_type="Synastry",
+        second_obj=ci.subject2,
+        **cfg
+    ),
+    "Transit": lambda ci, cfg: KerykeionChartSVG(
+        first_obj=ci.radix_subject,
+        chart_type="Transit",
+        second_obj=ci.transit_subject,
+        **cfg
+    ),
+    "Composite": lambda ci, cfg: KerykeionChartSVG(
+        first_obj=ci.composite_subject,
+        chart_type="Composite",
+        **cfg
+    ),
+}
+
+
 class ChartAdapter:
     """
     Adapter class between the new input structure and KerykeionChartSVG.
@@ -28,7 +53,9 @@ class ChartAdapter:
     This class bridges the gap between the new input classes and the existing
     KerykeionChartSVG implementation, allowing for a gradual transition.
     """
-    
+
+    __slots__ = ()
+
     @staticmethod
     def create_chart(chart_input: ChartInput) -> KerykeionChartSVG:
         """
@@ -43,59 +70,17 @@ class ChartAdapter:
         Raises:
             ValueError: If an unknown chart input type is provided
         """
-        # Extract configuration
-        config = chart_input.config
-        config_dict = config.model_dump(exclude_unset=True)
-        
-        # Rename fields to match KerykeionChartSVG parameters
-        if 'output_directory' in config_dict:
-            config_dict['new_output_directory'] = config_dict.pop('output_directory')
-            
-        if 'settings_file' in config_dict:
-            config_dict['new_settings_file'] = config_dict.pop('settings_file')
-        
-        # Handle different chart types
-        if isinstance(chart_input, NatalChartInput):
-            return KerykeionChartSVG(
-                first_obj=chart_input.subject,
-                chart_type="Natal",
-                **config_dict
-            )
-            
-        elif isinstance(chart_input, ExternalNatalChartInput):
-            return KerykeionChartSVG(
-                first_obj=chart_input.primary_subject,
-                chart_type="ExternalNatal",
-                second_obj=chart_input.external_subject,
-                **config_dict
-            )
-            
-        elif isinstance(chart_input, SynastryChartInput):
-            return KerykeionChartSVG(
-                first_obj=chart_input.subject1,
-                chart_type="Synastry",
-                second_obj=chart_input.subject2,
-                **config_dict
-            )
-            
-        elif isinstance(chart_input, TransitChartInput):
-            return KerykeionChartSVG(
-                first_obj=chart_input.radix_subject,
-                chart_type="Transit",
-                second_obj=chart_input.transit_subject,
-                **config_dict
-            )
-            
-        elif isinstance(chart_input, CompositeChartInput):
-            return KerykeionChartSVG(
-                first_obj=chart_input.composite_subject,
-                chart_type="Composite",
-                **config_dict
-            )
-            
-        else:
+        # Configuration as KerykeionChartSVG keyword arguments
+        config_dict = chart_input.config.to_svg_kwargs()
+
+        # The chart_type tag of the input selects the builder, the base ChartInput has none
+        chart_type: Optional[str] = getattr(chart_input, "chart_type", None)
+        builder = _BUILDERS.get(chart_type) if chart_type is not None else None
+        if builder is None:
             raise ValueError(f"Unknown chart input type: {type(chart_input)}")
 
+        return builder(chart_input, config_dict)
+
 
 # Convenience functions for creating charts
 def create_chart_from_input(chart_input: ChartInput) -> KerykeionChartSVG:
@@ -104,24 +89,20 @@ def create_chart_from_input(chart_input: ChartInput) -> KerykeionChartSVG:
 
 def create_natal_chart(subject, **config_kwargs) -> KerykeionChartSVG:
     """Create a natal chart."""
-    from kerykeion.charts.charts_inputs import ChartInputFactory
     chart_input = ChartInputFactory.create_natal_chart(subject, **config_kwargs)
     return create_chart_from_input(chart_input)
 
 def create_synastry_chart(subject1, subject2, **config_kwargs) -> KerykeionChartSVG:
     """Create a synastry chart."""
-    from kerykeion.charts.charts_inputs import ChartInputFactory
     chart_input = ChartInputFactory.create_synastry_chart(subject1, subject2, **config_kwargs)
     return create_chart_from_input(chart_input)
 
 def create_transit_chart(radix_subject, transit_subject, **config_kwargs) -> KerykeionChartSVG:
     """Create a transit chart."""
-    from kerykeion.charts.charts_inputs import ChartInputFactory
     chart_input = ChartInputFactory.create_transit_chart(radix_subject, transit_subject, **config_kwargs)
     return create_chart_from_input(chart_input)
 
 def create_composite_chart(composite_subject, **config_kwargs) -> KerykeionChartSVG:
     """Create a composite chart."""
-    from kerykeion.charts.charts_inputs import ChartInputFactory
     chart_input = ChartInputFactory.create_composite_chart(composite_subject, **config_kwargs)
     return create_chart_from_input(chart_input)
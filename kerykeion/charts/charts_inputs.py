@@ -6,7 +6,7 @@
     It helps with proper parameter encapsulation and validation for different chart types.
 """
 
-from typing import Union, List, Optional, Literal, Dict, Any, Type, TypeVar, Generic, ClassVar
+from typing import Union, List, Optional, Literal, Dict, Any, Type, TypeVar, Generic, ClassVar, Annotated, Callable
 from pathlib import Path
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -19,18 +19,25 @@ from kerykeion.kr_types import (
     CompositeSubjectModel,
     Planet, 
     AxialCusps, 
-    ActiveAspect,
-    ChartType
+    ActiveAspect
 )
 from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
 
 
+# ChartConfig fields whose KerykeionChartSVG parameter has a different name
+_SVG_KWARG_NAMES = {
+    "output_directory": "new_output_directory",
+    "settings_file": "new_settings_file",
+}
+
+
 class ChartConfig(BaseModel):
     """
     Common configuration parameters for all chart types.
     
     This class encapsulates configuration options that are common to all chart types,
-    providing default values where appropriate.
+    providing default values where appropriate. Configurations are immutable, use
+    model_copy(update={...}) to derive a modified one.
     
     Attributes:
         output_directory: Directory where SVG files will be saved (default: user's home directory)
@@ -40,6 +47,8 @@ class ChartConfig(BaseModel):
         active_points: List of planets/points to display (default: DEFAULT_ACTIVE_POINTS)
         active_aspects: List of aspects to calculate (default: DEFAULT_ACTIVE_ASPECTS)
         double_chart_aspect_grid_type: Display style for dual-chart aspect grids (default: "list")
+        coordinate_precision: Decimals of the SVG coordinates, zero or more, None for full precision (default: 2)
+        batch_aspect_lines: Merge aspect lines of the same color into one path, without per-aspect metadata (default: False)
     """
     output_directory: Union[str, Path, None] = None
     settings_file: Optional[Union[Path, dict, KerykeionSettingsModel]] = None
@@ -48,7 +57,11 @@ class ChartConfig(BaseModel):
     active_points: List[Union[Planet, AxialCusps]] = DEFAULT_ACTIVE_POINTS
     active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS
     double_chart_aspect_grid_type: Literal["list", "table"] = "list"
-    
+    coordinate_precision: Optional[int] = Field(default=2, ge=0)
+    batch_aspect_lines: bool = False
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
     @field_validator('output_directory', mode="before")
     def validate_output_directory(cls, v):
         """Convert string paths to Path objects and default to home directory if None."""
@@ -58,6 +71,14 @@ class ChartConfig(BaseModel):
             return Path(v)
         return v
 
+    def to_svg_kwargs(self) -> Dict[str, Any]:
+        """Return the configuration as KerykeionChartSVG keyword arguments."""
+        # The defaults match the KerykeionChartSVG ones, so every field can be passed on
+        return {
+            _SVG_KWARG_NAMES.get(name, name): getattr(self, name)
+            for name in type(self).model_fields
+        }
+
 
 class ChartInput(BaseModel):
     """
@@ -70,9 +91,26 @@ class ChartInput(BaseModel):
         config: Common chart configuration options
         chart_type: The type of chart to generate (set by subclasses)
     """
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Schemas are built on first use, defaults are trusted and unknown fields are rejected
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        defer_build=True,
+        validate_default=False,
+        extra="forbid",
+    )
     config: ChartConfig = Field(default_factory=ChartConfig)
-    chart_type: ClassVar[ChartType] = ""
+
+    @field_validator(
+        "subject", "primary_subject", "external_subject", "subject1", "subject2", "radix_subject", "transit_subject",
+        mode="before",
+        check_fields=False,
+    )
+    @classmethod
+    def validate_subject(cls, v):
+        """Store astrological subjects as their (cached) pydantic model."""
+        if isinstance(v, AstrologicalSubject):
+            return v.model()
+        return v
 
 
 class NatalChartInput(ChartInput):
@@ -90,12 +128,15 @@ class NatalChartInput(ChartInput):
         subject = AstrologicalSubject("John Doe", 1990, 1, 1, 12, 0, "New York")
         
         chart_input = NatalChartInput(subject=subject)
+
         # Optionally customize configuration
-        chart_input.config.theme = "dark"
-        chart_input.config.chart_language = "DE"
+        chart_input = NatalChartInput(
+            subject=subject,
+            config=ChartConfig(theme="dark", chart_language="DE")
+        )
         ```
     """
-    chart_type: ClassVar[ChartType] = "Natal"
+    chart_type: Literal["Natal"] = "Natal"
     subject: Union[AstrologicalSubject, AstrologicalSubjectModel]
 
 
@@ -121,7 +162,7 @@ class ExternalNatalChartInput(ChartInput):
         )
         ```
     """
-    chart_type: ClassVar[ChartType] = "ExternalNatal"
+    chart_type: Literal["ExternalNatal"] = "ExternalNatal"
     primary_subject: Union[AstrologicalSubject, AstrologicalSubjectModel]
     external_subject: Union[AstrologicalSubject, AstrologicalSubjectModel]
 
@@ -149,7 +190,7 @@ class SynastryChartInput(ChartInput):
         )
         ```
     """
-    chart_type: ClassVar[ChartType] = "Synastry"
+    chart_type: Literal["Synastry"] = "Synastry"
     subject1: Union[AstrologicalSubject, AstrologicalSubjectModel]
     subject2: Union[AstrologicalSubject, AstrologicalSubjectModel]
 
@@ -183,7 +224,7 @@ class TransitChartInput(ChartInput):
         )
         ```
     """
-    chart_type: ClassVar[ChartType] = "Transit"
+    chart_type: Literal["Transit"] = "Transit"
     radix_subject: Union[AstrologicalSubject, AstrologicalSubjectModel]
     transit_subject: Union[AstrologicalSubject, AstrologicalSubjectModel]
 
@@ -212,10 +253,17 @@ class CompositeChartInput(ChartInput):
         chart_input = CompositeChartInput(composite_subject=composite)
         ```
     """
-    chart_type: ClassVar[ChartType] = "Composite"
+    chart_type: Literal["Composite"] = "Composite"
     composite_subject: CompositeSubjectModel
 
 
+# Any concrete chart input, told apart by its chart_type tag (e.g. when validating JSON configurations)
+AnyChartInput = Annotated[
+    Union[NatalChartInput, ExternalNatalChartInput, SynastryChartInput, TransitChartInput, CompositeChartInput],
+    Field(discriminator="chart_type"),
+]
+
+
 class ChartInputFactory:
     """
     Factory for creating chart inputs from astrological subjects.
@@ -223,6 +271,16 @@ class ChartInputFactory:
     This factory provides convenience methods to create different
     types of chart inputs without directly instantiating the classes.
     """
+
+    # Creation function for each chart type, used by from_subjects and filled in after the class
+    _CREATORS: ClassVar[Dict[str, Callable[..., ChartInput]]]
+
+    # Chart types that need a second subject, with their name in error messages
+    _TWO_SUBJECT_CHARTS: ClassVar[Dict[str, str]] = {
+        "ExternalNatal": "External natal",
+        "Synastry": "Synastry",
+        "Transit": "Transit",
+    }
     
     @staticmethod
     def create_natal_chart(subject, **config_kwargs):
@@ -279,24 +337,26 @@ class ChartInputFactory:
         Raises:
             ValueError: If required subjects are missing for the specified chart type
         """
-        if chart_type == "Natal":
-            return cls.create_natal_chart(subject1, **config_kwargs)
-        elif chart_type == "ExternalNatal":
-            if subject2 is None:
-                raise ValueError("External natal chart requires two subjects")
-            return cls.create_external_natal_chart(subject1, subject2, **config_kwargs)
-        elif chart_type == "Synastry":
-            if subject2 is None:
-                raise ValueError("Synastry chart requires two subjects")
-            return cls.create_synastry_chart(subject1, subject2, **config_kwargs)
-        elif chart_type == "Transit":
-            if subject2 is None:
-                raise ValueError("Transit chart requires two subjects")
-            return cls.create_transit_chart(subject1, subject2, **config_kwargs)
-        elif chart_type == "Composite":
-            # For composite charts, subject1 should already be a CompositeSubjectModel
-            if not isinstance(subject1, CompositeSubjectModel):
-                raise ValueError("Composite chart requires a CompositeSubjectModel")
-            return cls.create_composite_chart(subject1, **config_kwargs)
-        else:
+        creator = cls._CREATORS.get(chart_type)
+        if creator is None:
             raise ValueError(f"Unknown chart type: {chart_type}")
+
+        if chart_type in cls._TWO_SUBJECT_CHARTS:
+            if subject2 is None:
+                raise ValueError(f"{cls._TWO_SUBJECT_CHARTS[chart_type]} chart requires two subjects")
+            return creator(subject1, subject2, **config_kwargs)
+
+        # For composite charts, subject1 should already be a CompositeSubjectModel
+        if chart_type == "Composite" and not isinstance(subject1, CompositeSubjectModel):
+            raise ValueError("Composite chart requires a CompositeSubjectModel")
+
+        return creator(subject1, **config_kwargs)
+
+
+ChartInputFactory._CREATORS = {
+    "Natal": ChartInputFactory.create_natal_chart,
+    "ExternalNatal": ChartInputFactory.create_external_natal_chart,
+    "Synastry": ChartInputFactory.create_synastry_chart,
+    "Transit": ChartInputFactory.create_transit_chart,
+    "Composite": ChartInputFactory.create_composite_chart,
+}
@@ -1,9 +1,52 @@
 import math
 import datetime
+import swisseph as swe
+from functools import lru_cache
 from kerykeion.kr_types import KerykeionException, ChartType
-from typing import Union, Literal
+from typing import Callable, Union, Literal, Sequence
 from kerykeion.kr_types.kr_models import AspectModel, KerykeionPointModel
-from kerykeion.kr_types.settings_models import KerykeionLanguageCelestialPointModel, KerykeionSettingsAspectModel
+from kerykeion.kr_types.settings_models import KerykeionLanguageCelestialPointModel, KerykeionSettingsAspectModel, KerykeionSettingsCelestialPointModel
+
+
+# Chart types drawn with a second subject on the outer ring
+_DOUBLE_CHART_TYPES = frozenset(("Transit", "Synastry"))
+
+# Seconds symbol of the degree strings written in the SVG markup, which is single-quoted only
+_SVG_SECONDS_SYMBOL = "'"
+
+
+@lru_cache(maxsize=64)
+def get_ayanamsa_name(sidereal_mode: str) -> str:
+    """
+    Return the Swiss Ephemeris ayanamsa name for a sidereal mode, once per mode.
+
+    Args:
+        sidereal_mode (str): The sidereal mode (e.g. "LAHIRI").
+
+    Returns:
+        str: The ayanamsa name (e.g. "Lahiri").
+    """
+    return swe.get_ayanamsa_name(getattr(swe, "SIDM_" + sidereal_mode))
+
+
+def format_iso_datetime_with_offset(iso_datetime: str) -> str:
+    """
+    Formats an ISO local datetime as "YYYY-MM-DD HH:MM [+HH:MM]" for the chart header.
+
+    The usual "YYYY-MM-DDTHH:MM:SS+HH:MM" shape is sliced directly, any other shape
+    (fractional seconds, offsets with seconds) goes through datetime parsing.
+
+    Args:
+        iso_datetime (str): The ISO formatted local datetime.
+
+    Returns:
+        str: The formatted datetime with its UTC offset.
+    """
+    if len(iso_datetime) == 25 and iso_datetime[19] in "+-":
+        return f"{iso_datetime[:10]} {iso_datetime[11:16]} [{iso_datetime[19:]}]"
+
+    custom_format = datetime.datetime.fromisoformat(iso_datetime).strftime('%Y-%m-%d %H:%M [%z]')
+    return custom_format[:-3] + ':' + custom_format[-3:]
 
 
 def get_decoded_kerykeion_celestial_point_name(input_planet_name: str, celestial_point_language: KerykeionLanguageCelestialPointModel) -> str:
@@ -156,6 +199,54 @@ def sliceToY(slice: Union[int, float], r: Union[int, float], offset: Union[int,
     return r * ((math.sin(radial) / -1) + 1)
 
 
+@lru_cache(maxsize=8)
+def _coordinate_formatter(coordinate_precision: Union[int, None]) -> Callable[[Union[int, float]], str]:
+    """Returns the function writing SVG coordinates with the given number of decimals.
+
+    Floats are written with exactly coordinate_precision decimals, and a value
+    rounding to zero is written without a minus sign. Integers are exact and are
+    written as they are. With None, floats keep their full precision.
+
+    Args:
+        - coordinate_precision (int | None): The number of decimals, None for full precision.
+
+    Returns:
+        Callable[[int | float], str]: The coordinate formatter.
+    """
+    if coordinate_precision is None:
+        return str
+
+    float_format = f".{coordinate_precision}f"
+
+    def format_coordinate(value: Union[int, float]) -> str:
+        if type(value) is int:
+            return str(value)
+        text = format(value, float_format)
+        if text[0] == "-" and not text.strip("-0."):
+            return text[1:]
+        return text
+
+    return format_coordinate
+
+
+def sliceToXY(slice: Union[int, float], r: Union[int, float], offset: Union[int, float]) -> tuple[float, float]:
+    """Calculates both coordinates of a point on a circle, computing the angle only once.
+
+    Equivalent to ``(sliceToX(slice, r, offset), sliceToY(slice, r, offset))``.
+
+    Args:
+        - slice (int | float): The slice of the circle, between 0 and 11 (inclusive).
+        - r (int | float): The radius of the circle.
+        - offset (int | float): The offset in degrees, between 0 and 360 (inclusive).
+
+    Returns:
+        tuple[float, float]: The x and y coordinates of the point on the circle.
+    """
+    plus = (math.pi * offset) / 180
+    radial = ((math.pi / 6) * slice) + plus
+    return r * (math.cos(radial) + 1), r * ((math.sin(radial) / -1) + 1)
+
+
 def draw_zodiac_slice(
     c1: Union[int, float],
     chart_type: ChartType,
@@ -164,6 +255,7 @@ def draw_zodiac_slice(
     r: Union[int, float],
     style: str,
     type: str,
+    coordinate_precision: Union[int, None] = None,
 ) -> str:
     """Draws a zodiac slice based on the given parameters.
 
@@ -178,33 +270,48 @@ def draw_zodiac_slice(
         - style (str): The CSS inline style.
         - type (str): The type ?. In OpenAstro, it was the symbol of the sign. Eg: "Ari".
             self.zodiac[i]["name"]
+        - coordinate_precision (int | None): Decimals of the coordinates, None for full precision.
 
     Returns:
         - str: The zodiac slice and symbol as an SVG path.
     """
 
+    radius, (x1, y1), (x2, y2), (x, y) = _zodiac_slice_coordinates(c1, chart_type, seventh_house_degree_ut, num, r)
+    fmt = _coordinate_formatter(coordinate_precision)
+
+    slice = f"<path d='M{str(r)},{str(r)} L{fmt(x1)},{fmt(y1)} A{str(radius)},{str(radius)} 0 0,0 {fmt(x2)},{fmt(y2)} z' style='{style}'/>"
+    sign = f"<g transform='translate(-16,-16)'><use x='{fmt(x)}' y='{fmt(y)}' xlink:href='#{type}' /></g>"
+
+    return slice + "" + sign
+
+
+def _zodiac_slice_coordinates(
+    c1: Union[int, float],
+    chart_type: ChartType,
+    seventh_house_degree_ut: Union[int, float],
+    num: int,
+    r: Union[int, float],
+) -> tuple[Union[int, float], tuple[float, float], tuple[float, float], tuple[float, float]]:
+    """Returns the arc radius, the two arc endpoints and the symbol position of a zodiac slice."""
+    double_chart = chart_type in _DOUBLE_CHART_TYPES
+
     # pie slices
     offset = 360 - seventh_house_degree_ut
-    # check transit
-    if chart_type == "Transit" or chart_type == "Synastry":
-        dropin: Union[int, float] = 0
-    else:
-        dropin = c1
-    slice = f'<path d="M{str(r)},{str(r)} L{str(dropin + sliceToX(num, r - dropin, offset))},{str(dropin + sliceToY(num, r - dropin, offset))} A{str(r - dropin)},{str(r - dropin)} 0 0,0 {str(dropin + sliceToX(num + 1, r - dropin, offset))},{str(dropin + sliceToY(num + 1, r - dropin, offset))} z" style="{style}"/>'
+    dropin: Union[int, float] = 0 if double_chart else c1
+    radius = r - dropin
+    x1, y1 = sliceToXY(num, radius, offset)
+    x2, y2 = sliceToXY(num + 1, radius, offset)
+    arc_start = (dropin + x1, dropin + y1)
+    arc_end = (dropin + x2, dropin + y2)
 
     # symbols
-    offset = offset + 15
-    # check transit
-    if chart_type == "Transit" or chart_type == "Synastry":
-        dropin = 54
-    else:
-        dropin = 18 + c1
-    sign = f'<g transform="translate(-16,-16)"><use x="{str(dropin + sliceToX(num, r - dropin, offset))}" y="{str(dropin + sliceToY(num, r - dropin, offset))}" xlink:href="#{type}" /></g>'
+    dropin = 54 if double_chart else 18 + c1
+    x, y = sliceToXY(num, r - dropin, offset + 15)
 
-    return slice + "" + sign
+    return radius, arc_start, arc_end, (dropin + x, dropin + y)
 
 
-def convert_latitude_coordinate_to_string(coord: Union[int, float], north_label: str, south_label: str) -> str:
+def convert_latitude_coordinate_to_string(coord: Union[int, float], north_label: str, south_label: str, seconds_symbol: str = '"') -> str:
     """Converts a floating point latitude to string with
     degree, minutes and seconds and the appropriate sign
     (north or south). Eg. 52.1234567 -> 52°7'25" N
@@ -213,6 +320,7 @@ def convert_latitude_coordinate_to_string(coord: Union[int, float], north_label:
         - coord (float | int): latitude in floating or integer format
         - north_label (str): String label for north
         - south_label (str): String label for south
+        - seconds_symbol (str): Symbol after the seconds, charts use "'" as their markup has no double quotes
     Returns:
         - str: latitude in string format with degree, minutes,
         seconds and sign (N/S)
@@ -225,10 +333,10 @@ def convert_latitude_coordinate_to_string(coord: Union[int, float], north_label:
     deg = int(coord)
     min = int((float(coord) - deg) * 60)
     sec = int(round(float(((float(coord) - deg) * 60) - min) * 60.0))
-    return f"{deg}°{min}'{sec}\" {sign}"
+    return f"{deg}°{min}'{sec}{seconds_symbol} {sign}"
 
 
-def convert_longitude_coordinate_to_string(coord: Union[int, float], east_label: str, west_label: str) -> str:
+def convert_longitude_coordinate_to_string(coord: Union[int, float], east_label: str, west_label: str, seconds_symbol: str = '"') -> str:
     """Converts a floating point longitude to string with
     degree, minutes and seconds and the appropriate sign
     (east or west). Eg. 52.1234567 -> 52°7'25" E
@@ -237,6 +345,7 @@ def convert_longitude_coordinate_to_string(coord: Union[int, float], east_label:
         - coord (float|int): longitude in floating point format
         - east_label (str): String label for east
         - west_label (str): String label for west
+        - seconds_symbol (str): Symbol after the seconds, charts use "'" as their markup has no double quotes
     Returns:
         str: longitude in string format with degree, minutes,
             seconds and sign (E/W)
@@ -249,7 +358,16 @@ def convert_longitude_coordinate_to_string(coord: Union[int, float], east_label:
     deg = int(coord)
     min = int((float(coord) - deg) * 60)
     sec = int(round(float(((float(coord) - deg) * 60) - min) * 60.0))
-    return f"{deg}°{min}'{sec}\" {sign}"
+    return f"{deg}°{min}'{sec}{seconds_symbol} {sign}"
+
+
+def _aspect_line_markup(aspect: Union[AspectModel, dict], color: str, x1: str, y1: str, x2: str, y2: str) -> str:
+    """Returns the SVG group of one aspect line, with the aspect metadata and the formatted endpoints."""
+    return (
+        f"<g kr:node='Aspect' kr:aspectname='{aspect['aspect']}' kr:to='{aspect['p1_name']}' kr:tooriginaldegrees='{aspect['p1_abs_pos']}' kr:from='{aspect['p2_name']}' kr:fromoriginaldegrees='{aspect['p2_abs_pos']}'>"
+        f"<line class='aspect' x1='{x1}' y1='{y1}' x2='{x2}' y2='{y2}' style='stroke: {color}; stroke-width: 1; stroke-opacity: .9;'/>"
+        f"</g>"
+    )
 
 
 def draw_aspect_line(
@@ -258,6 +376,7 @@ def draw_aspect_line(
     aspect: Union[AspectModel, dict],
     color: str,
     seventh_house_degree_ut: Union[int, float],
+    coordinate_precision: Union[int, None] = None,
 ) -> str:
     """Draws svg aspects: ring, aspect ring, degreeA degreeB
 
@@ -267,6 +386,7 @@ def draw_aspect_line(
         - aspect_dict (dict): The aspect dictionary.
         - color (str): The color of the aspect.
         - seventh_house_degree_ut (Union[int, float]): The degree of the seventh house.
+        - coordinate_precision (int | None): Decimals of the coordinates, None for full precision.
 
     Returns:
         str: The SVG line element as a string.
@@ -275,21 +395,131 @@ def draw_aspect_line(
     if isinstance(aspect, dict):
         aspect = AspectModel(**aspect)
 
+    fmt = _coordinate_formatter(coordinate_precision)
+    x1, y1, x2, y2 = map(fmt, _aspect_line_coordinates(r, ar, aspect, seventh_house_degree_ut))
+
+    return _aspect_line_markup(aspect, color, x1, y1, x2, y2)
+
+
+def draw_aspect_lines(
+    r: Union[int, float],
+    ar: Union[int, float],
+    aspects_with_colors: Sequence[tuple[Union[AspectModel, dict], str]],
+    seventh_house_degree_ut: Union[int, float],
+    coordinate_precision: Union[int, None] = None,
+) -> str:
+    """Draws svg aspects for a whole chart, same output as draw_aspect_line for each aspect.
+
+    The line endpoints of all the aspects are computed in one pass, sharing
+    the points on the circle between aspects at the same degree, and the
+    elements are joined once.
+
+    Args:
+        - r (Union[int, float]): The value of r.
+        - ar (Union[int, float]): The value of ar.
+        - aspects_with_colors (Sequence): (aspect, color) pairs, in drawing order.
+        - seventh_house_degree_ut (Union[int, float]): The degree of the seventh house.
+        - coordinate_precision (int | None): Decimals of the coordinates, None for full precision.
+
+    Returns:
+        str: The SVG line elements as a string.
+    """
+    endpoints = _aspect_lines_endpoints(
+        r, ar, [aspect for aspect, _ in aspects_with_colors], seventh_house_degree_ut, coordinate_precision
+    )
+
+    return "".join(
+        _aspect_line_markup(aspect, color, x1, y1, x2, y2)
+        for (aspect, color), (x1, y1, x2, y2) in zip(aspects_with_colors, endpoints)
+    )
+
+
+def draw_aspect_lines_batched(
+    r: Union[int, float],
+    ar: Union[int, float],
+    aspects_with_colors: Sequence[tuple[Union[AspectModel, dict], str]],
+    seventh_house_degree_ut: Union[int, float],
+    coordinate_precision: Union[int, None] = None,
+) -> str:
+    """Draws svg aspects grouped by color, one path element per color.
+
+    Lines sharing the same style are concatenated into a single path, which
+    keeps the SVG smaller and faster to parse. Unlike draw_aspect_line, the
+    per-aspect kr:node metadata groups are not emitted.
+
+    Args:
+        - r (Union[int, float]): The value of r.
+        - ar (Union[int, float]): The value of ar.
+        - aspects_with_colors (Sequence): (aspect, color) pairs, in drawing order.
+        - seventh_house_degree_ut (Union[int, float]): The degree of the seventh house.
+        - coordinate_precision (int | None): Decimals of the coordinates, None for full precision.
+
+    Returns:
+        str: The SVG path elements as a string.
+    """
+    endpoints = _aspect_lines_endpoints(
+        r, ar, [aspect for aspect, _ in aspects_with_colors], seventh_house_degree_ut, coordinate_precision
+    )
+
+    segments_by_color: dict[str, list[str]] = {}
+    for (_, color), (x1, y1, x2, y2) in zip(aspects_with_colors, endpoints):
+        segments_by_color.setdefault(color, []).append(f"M{x1},{y1} L{x2},{y2}")
+
+    return "".join(
+        f"<path class='aspect' d='{' '.join(segments)}' style='stroke: {color}; stroke-width: 1; stroke-opacity: .9;'/>"
+        for color, segments in segments_by_color.items()
+    )
+
+
+def _aspect_line_coordinates(
+    r: Union[int, float],
+    ar: Union[int, float],
+    aspect: Union[AspectModel, dict],
+    seventh_house_degree_ut: Union[int, float],
+) -> tuple[float, float, float, float]:
+    """Returns the (x1, y1, x2, y2) endpoints of an aspect line."""
     first_offset = (int(seventh_house_degree_ut) / -1) + int(aspect["p1_abs_pos"])
-    x1 = sliceToX(0, ar, first_offset) + (r - ar)
-    y1 = sliceToY(0, ar, first_offset) + (r - ar)
+    x1, y1 = sliceToXY(0, ar, first_offset)
 
     second_offset = (int(seventh_house_degree_ut) / -1) + int(aspect["p2_abs_pos"])
-    x2 = sliceToX(0, ar, second_offset) + (r - ar)
-    y2 = sliceToY(0, ar, second_offset) + (r - ar)
+    x2, y2 = sliceToXY(0, ar, second_offset)
 
-    return (
-        f'<g kr:node="Aspect" kr:aspectname="{aspect["aspect"]}" kr:to="{aspect["p1_name"]}" kr:tooriginaldegrees="{aspect["p1_abs_pos"]}" kr:from="{aspect["p2_name"]}" kr:fromoriginaldegrees="{aspect["p2_abs_pos"]}">'
-        f'<line class="aspect" x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {color}; stroke-width: 1; stroke-opacity: .9;"/>'
-        f"</g>"
-    )
+    return x1 + (r - ar), y1 + (r - ar), x2 + (r - ar), y2 + (r - ar)
 
-def convert_decimal_to_degree_string(dec: float, format_type: Literal["1", "2", "3"] = "3") -> str:
+
+def _aspect_lines_endpoints(
+    r: Union[int, float],
+    ar: Union[int, float],
+    aspects: Sequence[Union[AspectModel, dict]],
+    seventh_house_degree_ut: Union[int, float],
+    coordinate_precision: Union[int, None] = None,
+) -> list[tuple[str, str, str, str]]:
+    """Returns the (x1, y1, x2, y2) endpoints of several aspect lines, formatted for the SVG.
+
+    Lines only depend on the integer degrees of their points, so each point
+    on the circle is computed and formatted once and shared by all the aspects touching it.
+    """
+    fmt = _coordinate_formatter(coordinate_precision)
+    base_offset = int(seventh_house_degree_ut) / -1
+    shift = r - ar
+    points: dict[int, tuple[str, str]] = {}
+
+    def point(abs_pos) -> tuple[str, str]:
+        degree = int(abs_pos)
+        xy = points.get(degree)
+        if xy is None:
+            x, y = sliceToXY(0, ar, base_offset + degree)
+            xy = points[degree] = (fmt(x + shift), fmt(y + shift))
+        return xy
+
+    endpoints = []
+    for aspect in aspects:
+        x1, y1 = point(aspect["p1_abs_pos"])
+        x2, y2 = point(aspect["p2_abs_pos"])
+        endpoints.append((x1, y1, x2, y2))
+    return endpoints
+
+def convert_decimal_to_degree_string(dec: float, format_type: Literal["1", "2", "3"] = "3", seconds_symbol: str = '"') -> str:
     """
     Converts a decimal float to a degrees string in the specified format.
 
@@ -299,6 +529,7 @@ def convert_decimal_to_degree_string(dec: float, format_type: Literal["1", "2",
             - "1": a°
             - "2": a°b'
             - "3": a°b'c" (default)
+        seconds_symbol (str): Symbol after the seconds of format "3", charts use "'" as their markup has no double quotes.
 
     Returns:
         str: The degrees string in the specified format.
@@ -317,21 +548,25 @@ def convert_decimal_to_degree_string(dec: float, format_type: Literal["1", "2",
     elif format_type == "2":
         return f"{degrees}°{minutes:02d}'"
     elif format_type == "3":
-        return f"{degrees}°{minutes:02d}'{seconds:02d}\""
+        return f"{degrees}°{minutes:02d}'{seconds:02d}{seconds_symbol}"
 
 
-def draw_transit_ring_degree_steps(r: Union[int, float], seventh_house_degree_ut: Union[int, float]) -> str:
+def draw_transit_ring_degree_steps(
+    r: Union[int, float], seventh_house_degree_ut: Union[int, float], coordinate_precision: Union[int, None] = None
+) -> str:
     """Draws the transit ring degree steps.
 
     Args:
         - r (Union[int, float]): The value of r.
         - seventh_house_degree_ut (Union[int, float]): The degree of the seventh house.
+        - coordinate_precision (int | None): Decimals of the coordinates, None for full precision.
 
     Returns:
         str: The SVG path of the transit ring degree steps.
     """
 
-    out = '<g id="transitRingDegreeSteps">'
+    fmt = _coordinate_formatter(coordinate_precision)
+    out = "<g id='transitRingDegreeSteps'>"
     for i in range(72):
         offset = float(i * 5) - seventh_house_degree_ut
         if offset < 0:
@@ -342,14 +577,18 @@ def draw_transit_ring_degree_steps(r: Union[int, float], seventh_house_degree_ut
         y1 = sliceToY(0, r, offset)
         x2 = sliceToX(0, r + 2, offset) - 2
         y2 = sliceToY(0, r + 2, offset) - 2
-        out += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: #F00; stroke-width: 1px; stroke-opacity:.9;"/>'
+        out += f"<line x1='{fmt(x1)}' y1='{fmt(y1)}' x2='{fmt(x2)}' y2='{fmt(y2)}' style='stroke:#F00;stroke-width:1px;stroke-opacity:.9'/>"
     out += "</g>"
 
     return out
 
 
 def draw_degree_ring(
-    r: Union[int, float], c1: Union[int, float], seventh_house_degree_ut: Union[int, float], stroke_color: str
+    r: Union[int, float],
+    c1: Union[int, float],
+    seventh_house_degree_ut: Union[int, float],
+    stroke_color: str,
+    coordinate_precision: Union[int, None] = None,
 ) -> str:
     """Draws the degree ring.
 
@@ -358,11 +597,13 @@ def draw_degree_ring(
         - c1 (Union[int, float]): The value of c1.
         - seventh_house_degree_ut (Union[int, float]): The degree of the seventh house.
         - stroke_color (str): The color of the stroke.
+        - coordinate_precision (int | None): Decimals of the coordinates, None for full precision.
 
     Returns:
         str: The SVG path of the degree ring.
     """
-    out = '<g id="degreeRing">'
+    fmt = _coordinate_formatter(coordinate_precision)
+    out = "<g id='degreeRing'>"
     for i in range(72):
         offset = float(i * 5) - seventh_house_degree_ut
         if offset < 0:
@@ -374,7 +615,7 @@ def draw_degree_ring(
         x2 = sliceToX(0, r + 2 - c1, offset) - 2 + c1
         y2 = sliceToY(0, r + 2 - c1, offset) - 2 + c1
 
-        out += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {stroke_color}; stroke-width: 1px; stroke-opacity:.9;"/>'
+        out += f"<line x1='{fmt(x1)}' y1='{fmt(y1)}' x2='{fmt(x2)}' y2='{fmt(y2)}' style='stroke:{stroke_color};stroke-width:1px;stroke-opacity:.9'/>"
     out += "</g>"
 
     return out
@@ -394,8 +635,8 @@ def draw_transit_ring(r: Union[int, float], paper_1_color: str, zodiac_transit_r
     """
     radius_offset = 18
 
-    out = f'<circle cx="{r}" cy="{r}" r="{r - radius_offset}" style="fill: none; stroke: {paper_1_color}; stroke-width: 36px; stroke-opacity: .4;"/>'
-    out += f'<circle cx="{r}" cy="{r}" r="{r}" style="fill: none; stroke: {zodiac_transit_ring_3_color}; stroke-width: 1px; stroke-opacity: .6;"/>'
+    out = f"<circle cx='{r}' cy='{r}' r='{r - radius_offset}' style='fill:none;stroke:{paper_1_color};stroke-width:36px;stroke-opacity:.4'/>"
+    out += f"<circle cx='{r}' cy='{r}' r='{r}' style='fill:none;stroke:{zodiac_transit_ring_3_color};stroke-width:1px;stroke-opacity:.6'/>"
 
     return out
 
@@ -416,13 +657,13 @@ def draw_first_circle(
         str: The SVG path of the first circle.
     """
     if chart_type == "Synastry" or chart_type == "Transit":
-        return f'<circle cx="{r}" cy="{r}" r="{r - 36}" style="fill: none; stroke: {stroke_color}; stroke-width: 1px; stroke-opacity:.4;" />'
+        return f"<circle cx='{r}' cy='{r}' r='{r - 36}' style='fill:none;stroke:{stroke_color};stroke-width:1px;stroke-opacity:.4'/>"
     else:
         if c1 is None:
             raise KerykeionException("c1 is None")
 
         return (
-            f'<circle cx="{r}" cy="{r}" r="{r - c1}" style="fill: none; stroke: {stroke_color}; stroke-width: 1px; " />'
+            f"<circle cx='{r}' cy='{r}' r='{r - c1}' style='fill:none;stroke:{stroke_color};stroke-width:1px'/>"
         )
 
 
@@ -444,13 +685,13 @@ def draw_second_circle(
     """
 
     if chart_type == "Synastry" or chart_type == "Transit":
-        return f'<circle cx="{r}" cy="{r}" r="{r - 72}" style="fill: {fill_color}; fill-opacity:.4; stroke: {stroke_color}; stroke-opacity:.4; stroke-width: 1px" />'
+        return f"<circle cx='{r}' cy='{r}' r='{r - 72}' style='fill:{fill_color};fill-opacity:.4;stroke:{stroke_color};stroke-opacity:.4;stroke-width:1px'/>"
 
     else:
         if c2 is None:
             raise KerykeionException("c2 is None")
 
-        return f'<circle cx="{r}" cy="{r}" r="{r - c2}" style="fill: {fill_color}; fill-opacity:.2; stroke: {stroke_color}; stroke-opacity:.4; stroke-width: 1px" />'
+        return f"<circle cx='{r}' cy='{r}' r='{r - c2}' style='fill:{fill_color};fill-opacity:.2;stroke:{stroke_color};stroke-opacity:.4;stroke-width:1px'/>"
 
 
 def draw_third_circle(
@@ -473,12 +714,12 @@ def draw_third_circle(
     Returns:
     - str: The SVG element as a string.
     """
-    if chart_type in {"Synastry", "Transit"}:
+    if chart_type in _DOUBLE_CHART_TYPES:
         # For Synastry and Transit charts, use a fixed radius adjustment of 160
-        return f'<circle cx="{radius}" cy="{radius}" r="{radius - 160}" style="fill: {fill_color}; fill-opacity:.8; stroke: {stroke_color}; stroke-width: 1px" />'
+        return f"<circle cx='{radius}' cy='{radius}' r='{radius - 160}' style='fill:{fill_color};fill-opacity:.8;stroke:{stroke_color};stroke-width:1px'/>"
 
     else:
-        return f'<circle cx="{radius}" cy="{radius}" r="{radius - c3}" style="fill: {fill_color}; fill-opacity:.8; stroke: {stroke_color}; stroke-width: 1px" />'
+        return f"<circle cx='{radius}' cy='{radius}' r='{radius - c3}' style='fill:{fill_color};fill-opacity:.8;stroke:{stroke_color};stroke-width:1px'/>"
 
 
 def draw_aspect_grid(
@@ -501,8 +742,8 @@ def draw_aspect_grid(
     Returns:
         str: SVG string representing the aspect grid.
     """
-    svg_output = ""
-    style = f"stroke:{stroke_color}; stroke-width: 1px; stroke-width: 0.5px; fill:none"
+    svg_output = []
+    style = f"stroke:{stroke_color};stroke-width:0.5px;fill:none"
     box_size = 14
 
     # Filter active planets
@@ -511,10 +752,16 @@ def draw_aspect_grid(
     # Reverse the list of active planets for the first iteration
     reversed_planets = active_planets[::-1]
 
+    # Index the aspect degrees by (unordered) planet pair, keeping the aspects order
+    aspects_by_pair: dict[tuple, list] = {}
+    for aspect in aspects:
+        pair = (aspect["p1"], aspect["p2"]) if aspect["p1"] <= aspect["p2"] else (aspect["p2"], aspect["p1"])
+        aspects_by_pair.setdefault(pair, []).append(aspect["aspect_degrees"])
+
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
-        svg_output += f'<rect kr:node="AspectsGridRect" x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
-        svg_output += f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        svg_output.append(f"<rect kr:node='AspectsGridRect' x='{x_start}' y='{y_start}' width='{box_size}' height='{box_size}' style='{style}'/>")
+        svg_output.append(f"<use transform='scale(0.4)' x='{(x_start + 2) * 2.5}' y='{(y_start + 1) * 2.5}' xlink:href='#{planet_a['name']}' />")
 
         # Update the starting coordinates for the next box
         x_start += box_size
@@ -527,17 +774,16 @@ def draw_aspect_grid(
         # Iterate over the remaining planets
         for planet_b in reversed_planets[index + 1:]:
             # Draw the grid box for the aspect
-            svg_output += f'<rect kr:node="AspectsGridRect" x="{x_aspect}" y="{y_aspect}" width="{box_size}" height="{box_size}" style="{style}"/>'
+            svg_output.append(f"<rect kr:node='AspectsGridRect' x='{x_aspect}' y='{y_aspect}' width='{box_size}' height='{box_size}' style='{style}'/>")
             x_aspect += box_size
 
             # Check for aspects between the planets
-            for aspect in aspects:
-                if (aspect["p1"] == planet_a["id"] and aspect["p2"] == planet_b["id"]) or (
-                    aspect["p1"] == planet_b["id"] and aspect["p2"] == planet_a["id"]
-                ):
-                    svg_output += f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect["aspect_degrees"]}" />'
+            id_a, id_b = planet_a["id"], planet_b["id"]
+            pair = (id_a, id_b) if id_a <= id_b else (id_b, id_a)
+            for aspect_degrees in aspects_by_pair.get(pair, ()):
+                svg_output.append(f"<use  x='{x_aspect - box_size + 1}' y='{y_aspect + 1}' xlink:href='#orb{aspect_degrees}' />")
 
-    return svg_output
+    return "".join(svg_output)
 
 
 def draw_houses_cusps_and_text_number(
@@ -553,6 +799,7 @@ def draw_houses_cusps_and_text_number(
     chart_type: ChartType,
     second_subject_houses_list: Union[list[KerykeionPointModel], None] = None,
     transit_house_cusp_color: Union[str, None] = None,
+    coordinate_precision: Union[int, None] = None,
 ) -> str:
     """
     Draws the houses cusps and text numbers for a given chart type.
@@ -570,26 +817,28 @@ def draw_houses_cusps_and_text_number(
     - chart_type: Type of the chart (e.g., Transit, Synastry).
     - second_subject_houses_list: List of house for the second subject (optional).
     - transit_house_cusp_color: Color for transit house cusps (optional).
+    - coordinate_precision: Decimals of the coordinates, None for full precision (optional).
 
     Returns:
     - A string containing the SVG path for the houses cusps and text numbers.
     """
 
+    fmt = _coordinate_formatter(coordinate_precision)
     path = ""
     xr = 12
 
     for i in range(xr):
         # Determine offsets based on chart type
-        dropin, roff, t_roff = (160, 72, 36) if chart_type in ["Transit", "Synastry"] else (c3, c1, False)
+        dropin, roff, t_roff = (160, 72, 36) if chart_type in _DOUBLE_CHART_TYPES else (c3, c1, False)
 
         # Calculate the offset for the current house cusp
         offset = (int(first_subject_houses_list[int(xr / 2)].abs_pos) / -1) + int(first_subject_houses_list[i].abs_pos)
 
         # Calculate the coordinates for the house cusp lines
-        x1 = sliceToX(0, (r - dropin), offset) + dropin
-        y1 = sliceToY(0, (r - dropin), offset) + dropin
-        x2 = sliceToX(0, r - roff, offset) + roff
-        y2 = sliceToY(0, r - roff, offset) + roff
+        x1, y1 = sliceToXY(0, (r - dropin), offset)
+        x1, y1 = x1 + dropin, y1 + dropin
+        x2, y2 = sliceToXY(0, r - roff, offset)
+        x2, y2 = x2 + roff, y2 + roff
 
         # Calculate the text offset for the house number
         next_index = (i + 1) % xr
@@ -602,7 +851,7 @@ def draw_houses_cusps_and_text_number(
             i, standard_house_cusp_color
         )
 
-        if chart_type in ["Transit", "Synastry"]:
+        if chart_type in _DOUBLE_CHART_TYPES:
             if second_subject_houses_list is None or transit_house_cusp_color is None:
                 raise KerykeionException("second_subject_houses_list_ut or transit_house_cusp_color is None")
 
@@ -611,44 +860,43 @@ def draw_houses_cusps_and_text_number(
             t_offset = (zeropoint + second_subject_houses_list[i].abs_pos) % 360
 
             # Calculate the coordinates for the second subject's house cusp lines
-            t_x1 = sliceToX(0, (r - t_roff), t_offset) + t_roff
-            t_y1 = sliceToY(0, (r - t_roff), t_offset) + t_roff
-            t_x2 = sliceToX(0, r, t_offset)
-            t_y2 = sliceToY(0, r, t_offset)
+            t_x1, t_y1 = sliceToXY(0, (r - t_roff), t_offset)
+            t_x1, t_y1 = t_x1 + t_roff, t_y1 + t_roff
+            t_x2, t_y2 = sliceToXY(0, r, t_offset)
 
             # Calculate the text offset for the second subject's house number
             t_text_offset = t_offset + int(
                 degreeDiff(second_subject_houses_list[next_index].abs_pos, second_subject_houses_list[i].abs_pos) / 2
             )
             t_linecolor = linecolor if i in [0, 9, 6, 3] else transit_house_cusp_color
-            xtext = sliceToX(0, (r - 8), t_text_offset) + 8
-            ytext = sliceToY(0, (r - 8), t_text_offset) + 8
+            xtext, ytext = sliceToXY(0, (r - 8), t_text_offset)
+            xtext, ytext = xtext + 8, ytext + 8
 
             # Add the house number text for the second subject
             fill_opacity = "0" if chart_type == "Transit" else ".4"
-            path += f'<g kr:node="HouseNumber">'
-            path += f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: {fill_opacity}; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
+            path += f"<g kr:node='HouseNumber'>"
+            path += f"<text style='fill: var(--kerykeion-chart-color-house-number); fill-opacity: {fill_opacity}; font-size: 14px'><tspan x='{fmt(xtext - 3)}' y='{fmt(ytext + 3)}'>{i + 1}</tspan></text>"
             path += f"</g>"
 
             # Add the house cusp line for the second subject
             stroke_opacity = "0" if chart_type == "Transit" else ".3"
-            path += f'<g kr:node="Cusp">'
-            path += f"<line x1='{t_x1}' y1='{t_y1}' x2='{t_x2}' y2='{t_y2}' style='stroke: {t_linecolor}; stroke-width: 1px; stroke-opacity:{stroke_opacity};'/>"
+            path += f"<g kr:node='Cusp'>"
+            path += f"<line x1='{fmt(t_x1)}' y1='{fmt(t_y1)}' x2='{fmt(t_x2)}' y2='{fmt(t_y2)}' style='stroke: {t_linecolor}; stroke-width: 1px; stroke-opacity:{stroke_opacity};'/>"
             path += f"</g>"
 
         # Adjust dropin based on chart type
         dropin = {"Transit": 84, "Synastry": 84, "ExternalNatal": 100}.get(chart_type, 48)
-        xtext = sliceToX(0, (r - dropin), text_offset) + dropin
-        ytext = sliceToY(0, (r - dropin), text_offset) + dropin
+        xtext, ytext = sliceToXY(0, (r - dropin), text_offset)
+        xtext, ytext = xtext + dropin, ytext + dropin
 
         # Add the house cusp line for the first subject
-        path += f'<g kr:node="Cusp">'
-        path += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {linecolor}; stroke-width: 1px; stroke-dasharray:3,2; stroke-opacity:.4;"/>'
+        path += f"<g kr:node='Cusp'>"
+        path += f"<line x1='{fmt(x1)}' y1='{fmt(y1)}' x2='{fmt(x2)}' y2='{fmt(y2)}' style='stroke: {linecolor}; stroke-width: 1px; stroke-dasharray:3,2; stroke-opacity:.4;'/>"
         path += f"</g>"
 
         # Add the house number text for the first subject
-        path += f'<g kr:node="HouseNumber">'
-        path += f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: .6; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
+        path += f"<g kr:node='HouseNumber'>"
+        path += f"<text style='fill: var(--kerykeion-chart-color-house-number); fill-opacity: .6; font-size: 14px'><tspan x='{fmt(xtext - 3)}' y='{fmt(ytext + 3)}'>{i + 1}</tspan></text>"
         path += f"</g>"
 
     return path
@@ -685,7 +933,7 @@ def draw_transit_aspect_list(
 
     line = 0
     nl = 0
-    inner_path = ""
+    inner_path = []
     for i, aspect in enumerate(aspects_list):
         # Adjust the vertical position for every 12 aspects
         if i == 14:
@@ -712,34 +960,34 @@ def draw_transit_aspect_list(
             else:
                 line = 0
 
-        inner_path += f'<g transform="translate({nl},{line})">'
+        inner_path.append(f"<g transform='translate({nl},{line})'>")
 
         # first planet symbol
-        inner_path += f'<use transform="scale(0.4)" x="0" y="3" xlink:href="#{celestial_point_language[aspects_list[i]["p1"]]["name"]}" />'
+        inner_path.append(f"<use transform='scale(0.4)' x='0' y='3' xlink:href='#{celestial_point_language[aspects_list[i]['p1']]['name']}' />")
 
         # aspect symbol
         # TODO: Remove the "degree" element EVERYWHERE!
         aspect_name = aspects_list[i]["aspect"]
         id_value = next((a["degree"] for a in aspects_settings if a["name"] == aspect_name), None) # type: ignore
-        inner_path += f'<use  x="15" y="0" xlink:href="#orb{id_value}" />'
+        inner_path.append(f"<use  x='15' y='0' xlink:href='#orb{id_value}' />")
 
         # second planet symbol
-        inner_path += f'<g transform="translate(30,0)">'
-        inner_path += f'<use transform="scale(0.4)" x="0" y="3" xlink:href="#{celestial_point_language[aspects_list[i]["p2"]]["name"]}" />'
-        inner_path += f"</g>"
+        inner_path.append(f"<g transform='translate(30,0)'>")
+        inner_path.append(f"<use transform='scale(0.4)' x='0' y='3' xlink:href='#{celestial_point_language[aspects_list[i]['p2']]['name']}' />")
+        inner_path.append(f"</g>")
 
         # difference in degrees
-        inner_path += f'<text y="8" x="45" style="fill: var(--kerykeion-chart-color-paper-0); font-size: 10px;">{convert_decimal_to_degree_string(aspects_list[i]["orbit"])}</text>'
+        inner_path.append(f"<text y='8' x='45' style='fill: var(--kerykeion-chart-color-paper-0); font-size: 10px;'>{convert_decimal_to_degree_string(aspects_list[i]['orbit'], seconds_symbol=_SVG_SECONDS_SYMBOL)}</text>")
         # line
-        inner_path += f"</g>"
+        inner_path.append(f"</g>")
         line = line + 14
 
-    out = '<g transform="translate(526,273)">'
-    out += f'<text y="-15" x="0" style="fill: var(--kerykeion-chart-color-paper-0); font-size: 14px;">{grid_title}:</text>'
-    out += inner_path
-    out += '</g>'
-
-    return out
+    return (
+        "<g transform='translate(526,273)'>"
+        f"<text y='-15' x='0' style='fill: var(--kerykeion-chart-color-paper-0); font-size: 14px;'>{grid_title}:</text>"
+        f'{"".join(inner_path)}'
+        '</g>'
+    )
 
 
 def calculate_moon_phase_chart_params(
@@ -804,6 +1052,81 @@ def calculate_moon_phase_chart_params(
         "lunar_phase_rotate": lunar_phase_rotate,
     }
 
+# Element accumulator of each zodiac sign, indexed by sign number (0 = Aries):
+# fire = 0, earth = 1, air = 2, water = 3
+def calculate_element_percentages(element_points: Sequence[float]) -> list[int]:
+    """
+    Converts element points to integer percentages that always add up to 100.
+
+    Percentages are apportioned with the largest remainder method: each one is
+    floored, then the missing units go to the largest remainders. Floors and
+    remainders come from divmod, so integer points never go through floats.
+    Equal remainders are served in element order, and no points give 0 everywhere.
+
+    Args:
+        - element_points (Sequence[float]): The points of each element.
+
+    Returns:
+        list[int]: The percentage of each element, in the same order.
+    """
+    total = sum(element_points)
+    if not total:
+        return [0] * len(element_points)
+
+    quotients = [divmod(100 * points, total) for points in element_points]
+    percentages = [int(floor) for floor, _ in quotients]
+
+    by_remainder = sorted(range(len(quotients)), key=lambda i: quotients[i][1], reverse=True)
+    for i in by_remainder[: 100 - sum(percentages)]:
+        percentages[i] += 1
+
+    return percentages
+
+
+_SIGN_ELEMENT_INDEX = (0, 1, 2, 3) * 3
+
+
+def calculate_element_points_batch(
+    subjects_points: Sequence[Sequence[KerykeionPointModel]],
+    available_planets_setting: Sequence[KerykeionSettingsCelestialPointModel],
+    planet_in_zodiac_extra_points: int,
+) -> list[tuple[float, float, float, float]]:
+    """
+    Calculates the fire, earth, air and water points of several subjects.
+
+    The points of each body, bonus included, are tabulated once for the 12 signs,
+    so every subject only costs one sign lookup and one addition per body.
+
+    Args:
+        - subjects_points (Sequence): For each subject, its points of the active bodies,
+          in the same order as available_planets_setting.
+        - available_planets_setting (Sequence): The settings of the active bodies.
+        - planet_in_zodiac_extra_points (int): Bonus for a body in one of its related signs.
+
+    Returns:
+        list[tuple[float, float, float, float]]: The fire, earth, air and water points of each subject.
+    """
+    points_by_sign = [
+        tuple(
+            body["element_points"] + (planet_in_zodiac_extra_points if sign_num in body["related_zodiac_signs_set"] else 0)
+            for sign_num in range(12)
+        )
+        for body in available_planets_setting
+    ]
+
+    sign_element_index = _SIGN_ELEMENT_INDEX
+    results = []
+    for points in subjects_points:
+        element_points = [0.0, 0.0, 0.0, 0.0]
+        for point, body_points in zip(points, points_by_sign):
+            sign_num = point.sign_num
+            element_points[sign_element_index[sign_num]] += body_points[sign_num]
+
+        results.append((element_points[0], element_points[1], element_points[2], element_points[3]))
+
+    return results
+
+
 def draw_house_grid(
         main_subject_houses_list: list[KerykeionPointModel],
         chart_type: ChartType,
@@ -825,19 +1148,19 @@ def draw_house_grid(
     - str: The SVG code for the grid of houses.
     """
 
-    if chart_type in ["Synastry", "Transit"] and secondary_subject_houses_list is None:
+    if chart_type in _DOUBLE_CHART_TYPES and secondary_subject_houses_list is None:
         raise KerykeionException("secondary_houses is None")
 
-    svg_output = '<g transform="translate(650,-20)">'
+    svg_output = "<g transform='translate(650,-20)'>"
 
     line_increment = 10
     for i, house in enumerate(main_subject_houses_list):
         cusp_number = f"&#160;&#160;{i + 1}" if i < 9 else str(i + 1)
         svg_output += (
-            f'<g transform="translate(0,{line_increment})">'
-            f'<text text-anchor="end" x="40" style="fill:{text_color}; font-size: 10px;">{house_cusp_generale_name_label} {cusp_number}:</text>'
-            f'<g transform="translate(40,-8)"><use transform="scale(0.3)" xlink:href="#{house["sign"]}" /></g>'
-            f'<text x="53" style="fill:{text_color}; font-size: 10px;"> {convert_decimal_to_degree_string(house["position"])}</text>'
+            f"<g transform='translate(0,{line_increment})'>"
+            f"<text text-anchor='end' x='40' style='fill:{text_color}; font-size: 10px;'>{house_cusp_generale_name_label} {cusp_number}:</text>"
+            f"<g transform='translate(40,-8)'><use transform='scale(0.3)' xlink:href='#{house['sign']}' /></g>"
+            f"<text x='53' style='fill:{text_color}; font-size: 10px;'> {convert_decimal_to_degree_string(house['position'], seconds_symbol=_SVG_SECONDS_SYMBOL)}</text>"
             f'</g>'
         )
         line_increment += 14
@@ -846,16 +1169,16 @@ def draw_house_grid(
 
     if chart_type == "Synastry":
         svg_output += '<!-- Synastry Houses -->'
-        svg_output += '<g transform="translate(910, -20)">'
+        svg_output += "<g transform='translate(910, -20)'>"
         line_increment = 10
 
         for i, house in enumerate(secondary_subject_houses_list): # type: ignore
             cusp_number = f"&#160;&#160;{i + 1}" if i < 9 else str(i + 1)
             svg_output += (
-                f'<g transform="translate(0,{line_increment})">'
-                f'<text text-anchor="end" x="40" style="fill:{text_color}; font-size: 10px;">{house_cusp_generale_name_label} {cusp_number}:</text>'
-                f'<g transform="translate(40,-8)"><use transform="scale(0.3)" xlink:href="#{house["sign"]}" /></g>'
-                f'<text x="53" style="fill:{text_color}; font-size: 10px;"> {convert_decimal_to_degree_string(house["position"])}</text>'
+                f"<g transform='translate(0,{line_increment})'>"
+                f"<text text-anchor='end' x='40' style='fill:{text_color}; font-size: 10px;'>{house_cusp_generale_name_label} {cusp_number}:</text>"
+                f"<g transform='translate(40,-8)'><use transform='scale(0.3)' xlink:href='#{house['sign']}' /></g>"
+                f"<text x='53' style='fill:{text_color}; font-size: 10px;'> {convert_decimal_to_degree_string(house['position'], seconds_symbol=_SVG_SECONDS_SYMBOL)}</text>"
                 f'</g>'
             )
             line_increment += 14
@@ -896,8 +1219,8 @@ def draw_planet_grid(
     offset_between_lines = 14
 
     svg_output = (
-        f'<g transform="translate(175, -15)">'
-        f'<text text-anchor="end" style="fill:{text_color}; font-size: 14px;">{planets_and_houses_grid_title} {subject_name}:</text>'
+        f"<g transform='translate(175, -15)'>"
+        f"<text text-anchor='end' style='fill:{text_color}; font-size: 14px;'>{planets_and_houses_grid_title} {subject_name}:</text>"
         f'</g>'
     )
 
@@ -910,32 +1233,32 @@ def draw_planet_grid(
 
         decoded_name = get_decoded_kerykeion_celestial_point_name(planet["name"], celestial_point_language)
         svg_output += (
-            f'<g transform="translate({offset},{line_height})">'
-            f'<text text-anchor="end" style="fill:{text_color}; font-size: 10px;">{decoded_name}</text>'
-            f'<g transform="translate(5,-8)"><use transform="scale(0.4)" xlink:href="#{planet["name"]}" /></g>'
-            f'<text text-anchor="start" x="19" style="fill:{text_color}; font-size: 10px;">{convert_decimal_to_degree_string(planet["position"])}</text>'
-            f'<g transform="translate(60,-8)"><use transform="scale(0.3)" xlink:href="#{planet["sign"]}" /></g>'
+            f"<g transform='translate({offset},{line_height})'>"
+            f"<text text-anchor='end' style='fill:{text_color}; font-size: 10px;'>{decoded_name}</text>"
+            f"<g transform='translate(5,-8)'><use transform='scale(0.4)' xlink:href='#{planet['name']}' /></g>"
+            f"<text text-anchor='start' x='19' style='fill:{text_color}; font-size: 10px;'>{convert_decimal_to_degree_string(planet['position'], seconds_symbol=_SVG_SECONDS_SYMBOL)}</text>"
+            f"<g transform='translate(60,-8)'><use transform='scale(0.3)' xlink:href='#{planet['sign']}' /></g>"
         )
 
         if planet["retrograde"]:
-            svg_output += '<g transform="translate(74,-6)"><use transform="scale(.5)" xlink:href="#retrograde" /></g>'
+            svg_output += "<g transform='translate(74,-6)'><use transform='scale(.5)' xlink:href='#retrograde' /></g>"
 
         svg_output += end_of_line
         line_height += offset_between_lines
 
-    if chart_type in ["Transit", "Synastry"]:
+    if chart_type in _DOUBLE_CHART_TYPES:
         if second_subject_available_kerykeion_celestial_points is None:
             raise KerykeionException("second_subject_available_kerykeion_celestial_points is None")
 
         if chart_type == "Transit":
             svg_output += (
-                f'<g transform="translate(320, -15)">'
-                f'<text text-anchor="end" style="fill:{text_color}; font-size: 14px;">{second_subject_name}:</text>'
+                f"<g transform='translate(320, -15)'>"
+                f"<text text-anchor='end' style='fill:{text_color}; font-size: 14px;'>{second_subject_name}:</text>"
             )
         else:
             svg_output += (
-                f'<g transform="translate(380, -15)">'
-                f'<text text-anchor="end" style="fill:{text_color}; font-size: 14px;">{planets_and_houses_grid_title} {second_subject_name}:</text>'
+                f"<g transform='translate(380, -15)'>"
+                f"<text text-anchor='end' style='fill:{text_color}; font-size: 14px;'>{planets_and_houses_grid_title} {second_subject_name}:</text>"
             )
 
         svg_output += end_of_line
@@ -950,15 +1273,15 @@ def draw_planet_grid(
 
             second_decoded_name = get_decoded_kerykeion_celestial_point_name(t_planet["name"], celestial_point_language)
             svg_output += (
-                f'<g transform="translate({second_offset},{second_line_height})">'
-                f'<text text-anchor="end" style="fill:{text_color}; font-size: 10px;">{second_decoded_name}</text>'
-                f'<g transform="translate(5,-8)"><use transform="scale(0.4)" xlink:href="#{t_planet["name"]}" /></g>'
-                f'<text text-anchor="start" x="19" style="fill:{text_color}; font-size: 10px;">{convert_decimal_to_degree_string(t_planet["position"])}</text>'
-                f'<g transform="translate(60,-8)"><use transform="scale(0.3)" xlink:href="#{t_planet["sign"]}" /></g>'
+                f"<g transform='translate({second_offset},{second_line_height})'>"
+                f"<text text-anchor='end' style='fill:{text_color}; font-size: 10px;'>{second_decoded_name}</text>"
+                f"<g transform='translate(5,-8)'><use transform='scale(0.4)' xlink:href='#{t_planet['name']}' /></g>"
+                f"<text text-anchor='start' x='19' style='fill:{text_color}; font-size: 10px;'>{convert_decimal_to_degree_string(t_planet['position'], seconds_symbol=_SVG_SECONDS_SYMBOL)}</text>"
+                f"<g transform='translate(60,-8)'><use transform='scale(0.3)' xlink:href='#{t_planet['sign']}' /></g>"
             )
 
             if t_planet["retrograde"]:
-                svg_output += '<g transform="translate(74,-6)"><use transform="scale(.5)" xlink:href="#retrograde" /></g>'
+                svg_output += "<g transform='translate(74,-6)'><use transform='scale(.5)' xlink:href='#retrograde' /></g>"
 
             svg_output += end_of_line
             second_line_height += offset_between_lines
@@ -988,8 +1311,8 @@ def draw_transit_aspect_grid(
     Returns:
         str: SVG string representing the aspect grid.
     """
-    svg_output = ""
-    style = f"stroke:{stroke_color}; stroke-width: 1px; stroke-width: 0.5px; fill:none"
+    svg_output = []
+    style = f"stroke:{stroke_color};stroke-width:0.5px;fill:none"
     x_start = x_indent
     y_start = y_indent
 
@@ -998,10 +1321,16 @@ def draw_transit_aspect_grid(
 
     # Reverse the list of active planets for the first iteration
     reversed_planets = active_planets[::-1]
+
+    # Index the aspect degrees by (p1, p2) pair, keeping the aspects order
+    aspects_by_pair: dict[tuple, list] = {}
+    for aspect in aspects:
+        aspects_by_pair.setdefault((aspect["p1"], aspect["p2"]), []).append(aspect["aspect_degrees"])
+
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
-        svg_output += f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
-        svg_output += f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        svg_output.append(f"<rect x='{x_start}' y='{y_start}' width='{box_size}' height='{box_size}' style='{style}'/>")
+        svg_output.append(f"<use transform='scale(0.4)' x='{(x_start + 2) * 2.5}' y='{(y_start + 1) * 2.5}' xlink:href='#{planet_a['name']}' />")
         x_start += box_size
 
     x_start = x_indent - box_size
@@ -1009,8 +1338,8 @@ def draw_transit_aspect_grid(
 
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
-        svg_output += f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
-        svg_output += f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        svg_output.append(f"<rect x='{x_start}' y='{y_start}' width='{box_size}' height='{box_size}' style='{style}'/>")
+        svg_output.append(f"<use transform='scale(0.4)' x='{(x_start + 2) * 2.5}' y='{(y_start + 1) * 2.5}' xlink:href='#{planet_a['name']}' />")
         y_start -= box_size
 
     x_start = x_indent
@@ -1019,7 +1348,7 @@ def draw_transit_aspect_grid(
 
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
-        svg_output += f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
+        svg_output.append(f"<rect x='{x_start}' y='{y_start}' width='{box_size}' height='{box_size}' style='{style}'/>")
 
         # Update the starting coordinates for the next box
         y_start -= box_size
@@ -1031,12 +1360,11 @@ def draw_transit_aspect_grid(
         # Iterate over the remaining planets
         for planet_b in reversed_planets:
             # Draw the grid box for the aspect
-            svg_output += f'<rect x="{x_aspect}" y="{y_aspect}" width="{box_size}" height="{box_size}" style="{style}"/>'
+            svg_output.append(f"<rect x='{x_aspect}' y='{y_aspect}' width='{box_size}' height='{box_size}' style='{style}'/>")
             x_aspect += box_size
 
             # Check for aspects between the planets
-            for aspect in aspects:
-                if (aspect["p1"] == planet_a["id"] and aspect["p2"] == planet_b["id"]):
-                    svg_output += f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect["aspect_degrees"]}" />'
+            for aspect_degrees in aspects_by_pair.get((planet_a["id"], planet_b["id"]), ()):
+                svg_output.append(f"<use  x='{x_aspect - box_size + 1}' y='{y_aspect + 1}' xlink:href='#orb{aspect_degrees}' />")
 
-    return svg_output
+    return "".join(svg_output)
@@ -1,6 +1,6 @@
 # type: ignore
 
-from kerykeion.charts.charts_utils import degreeDiff, sliceToX, sliceToY, convert_decimal_to_degree_string
+from kerykeion.charts.charts_utils import _DOUBLE_CHART_TYPES, _coordinate_formatter, degreeDiff, sliceToX, sliceToY, convert_decimal_to_degree_string
 from kerykeion.kr_types import KerykeionException, ChartType, KerykeionPointModel
 from kerykeion.kr_types.settings_models import KerykeionSettingsCelestialPointModel
 from kerykeion.kr_types.kr_literals import Houses
@@ -8,6 +8,9 @@ import logging
 from typing import Union, get_args
 
 
+# House cusps are not drawn on the transit ring
+_TRANSIT_RING_EXCLUDE_POINTS_NAMES = get_args(Houses)
+
 
 def draw_planets(
     radius: Union[int, float],
@@ -18,6 +21,7 @@ def draw_planets(
     main_subject_seventh_house_degree_ut: Union[int, float],
     chart_type: ChartType,
     second_subject_available_kerykeion_celestial_points: Union[list[KerykeionPointModel], None] = None,
+    coordinate_precision: Union[int, None] = None,
 ):
     """
     Draws the planets on a chart based on the provided parameters.
@@ -32,6 +36,7 @@ def draw_planets(
         chart_type (ChartType): Type of the chart (e.g., "Transit", "Synastry").
         second_subject_available_kerykeion_celestial_points (Union[list[KerykeionPointModel], None], optional): 
             List of celestial points for the second subject, required for "Transit" or "Synastry" charts. Defaults to None.
+        coordinate_precision (Union[int, None], optional): Decimals of the coordinates, None for full precision. Defaults to None.
 
     Raises:
         KerykeionException: If the second subject is required but not provided.
@@ -39,9 +44,10 @@ def draw_planets(
     Returns:
         str: SVG output for the chart with the planets drawn.
     """
-    TRANSIT_RING_EXCLUDE_POINTS_NAMES = get_args(Houses)
+    TRANSIT_RING_EXCLUDE_POINTS_NAMES = _TRANSIT_RING_EXCLUDE_POINTS_NAMES
+    fmt = _coordinate_formatter(coordinate_precision)
 
-    if chart_type == "Transit" or chart_type == "Synastry":
+    if chart_type in _DOUBLE_CHART_TYPES:
         if second_subject_available_kerykeion_celestial_points is None:
             raise KerykeionException("Second subject is required for Transit or Synastry charts")
 
@@ -55,7 +61,7 @@ def draw_planets(
     for planet in available_kerykeion_celestial_points:
         points_deg.append(planet.position)
 
-    if chart_type == "Transit" or chart_type == "Synastry":
+    if chart_type in _DOUBLE_CHART_TYPES:
         # Make a list for the absolute degrees of the points of the graphic.
         t_points_deg_ut = []
         for planet in second_subject_available_kerykeion_celestial_points:
@@ -198,7 +204,7 @@ def draw_planets(
         i = planets_degut[keys[e]]
 
         # coordinates
-        if chart_type == "Transit" or chart_type == "Synastry":
+        if chart_type in _DOUBLE_CHART_TYPES:
             if 22 < i < 27:
                 rplanet = 76
             elif switch == 1:
@@ -232,7 +238,7 @@ def draw_planets(
 
         planet_x = sliceToX(0, (radius - rplanet), offset) + rplanet
         planet_y = sliceToY(0, (radius - rplanet), offset) + rplanet
-        if chart_type == "Transit" or chart_type == "Synastry":
+        if chart_type in _DOUBLE_CHART_TYPES:
             scale = 0.8
 
         elif chart_type == "ExternalNatal":
@@ -244,8 +250,8 @@ def draw_planets(
             y2 = sliceToY(0, (radius - rplanet - 30), trueoffset) + rplanet + 30
             color = available_planets_setting[i]["color"]
             output += (
-                '<line x1="%s" y1="%s" x2="%s" y2="%s" style="stroke-width:1px;stroke:%s;stroke-opacity:.3;"/>\n'
-                % (x1, y1, x2, y2, color)
+                "<line x1='%s' y1='%s' x2='%s' y2='%s' style='stroke-width:1px;stroke:%s;stroke-opacity:.3;'/>\n"
+                % (fmt(x1), fmt(y1), fmt(x2), fmt(y2), color)
             )
             # line2
             x1 = sliceToX(0, (radius - rplanet - 30), trueoffset) + rplanet + 30
@@ -253,8 +259,8 @@ def draw_planets(
             x2 = sliceToX(0, (radius - rplanet - 10), offset) + rplanet + 10
             y2 = sliceToY(0, (radius - rplanet - 10), offset) + rplanet + 10
             output += (
-                '<line x1="%s" y1="%s" x2="%s" y2="%s" style="stroke-width:1px;stroke:%s;stroke-opacity:.5;"/>\n'
-                % (x1, y1, x2, y2, color)
+                "<line x1='%s' y1='%s' x2='%s' y2='%s' style='stroke-width:1px;stroke:%s;stroke-opacity:.5;'/>\n"
+                % (fmt(x1), fmt(y1), fmt(x2), fmt(y2), color)
             )
 
         else:
@@ -262,12 +268,12 @@ def draw_planets(
 
         planet_details = available_kerykeion_celestial_points[i]
 
-        output += f'<g kr:node="ChartPoint" kr:house="{planet_details["house"]}" kr:sign="{planet_details["sign"]}" kr:slug="{planet_details["name"]}" transform="translate(-{12 * scale},-{12 * scale}) scale({scale})">'
-        output += f'<use x="{planet_x * (1/scale)}" y="{planet_y * (1/scale)}" xlink:href="#{available_planets_setting[i]["name"]}" />'
+        output += f"<g kr:node='ChartPoint' kr:house='{planet_details['house']}' kr:sign='{planet_details['sign']}' kr:slug='{planet_details['name']}' transform='translate(-{fmt(12 * scale)},-{fmt(12 * scale)}) scale({scale})'>"
+        output += f"<use x='{fmt(planet_x * (1/scale))}' y='{fmt(planet_y * (1/scale))}' xlink:href='#{available_planets_setting[i]['name']}' />"
         output += f"</g>"
 
     # make transit degut and display planets
-    if chart_type == "Transit" or chart_type == "Synastry":
+    if chart_type in _DOUBLE_CHART_TYPES:
         group_offset = {}
         t_planets_degut = {}
         list_range = len(available_planets_setting)
@@ -344,14 +350,14 @@ def draw_planets(
                 t_offset = t_offset - 360
             planet_x = sliceToX(0, (radius - rplanet), t_offset) + rplanet
             planet_y = sliceToY(0, (radius - rplanet), t_offset) + rplanet
-            output += f'<g class="transit-planet-name" transform="translate(-6,-6)"><g transform="scale(0.5)"><use x="{planet_x*2}" y="{planet_y*2}" xlink:href="#{available_planets_setting[i]["name"]}" /></g></g>'
+            output += f"<g class='transit-planet-name' transform='translate(-6,-6)'><g transform='scale(0.5)'><use x='{fmt(planet_x*2)}' y='{fmt(planet_y*2)}' xlink:href='#{available_planets_setting[i]['name']}' /></g></g>"
 
             # Transit planet line
             x1 = sliceToX(0, radius + 3, t_offset) - 3
             y1 = sliceToY(0, radius + 3, t_offset) - 3
             x2 = sliceToX(0, radius - 3, t_offset) + 3
             y2 = sliceToY(0, radius - 3, t_offset) + 3
-            output += f'<line class="transit-planet-line" x1="{str(x1)}" y1="{str(y1)}" x2="{str(x2)}" y2="{str(y2)}" style="stroke: {available_planets_setting[i]["color"]}; stroke-width: 1px; stroke-opacity:.8;"/>'
+            output += f"<line class='transit-planet-line' x1='{fmt(x1)}' y1='{fmt(y1)}' x2='{fmt(x2)}' y2='{fmt(y2)}' style='stroke: {available_planets_setting[i]['color']}; stroke-width: 1px; stroke-opacity:.8;'/>"
 
             # transit planet degree text
             rotate = main_subject_first_house_degree_ut - t_points_deg_ut[i]
@@ -373,13 +379,13 @@ def draw_planets(
             deg_x = sliceToX(0, (radius - rtext), t_offset + xo) + rtext
             deg_y = sliceToY(0, (radius - rtext), t_offset + xo) + rtext
             degree = int(t_offset)
-            output += f'<g transform="translate({deg_x},{deg_y})">'
-            output += f'<text transform="rotate({rotate})" text-anchor="{textanchor}'
-            output += f'" style="fill: {available_planets_setting[i]["color"]}; font-size: 10px;">{convert_decimal_to_degree_string(t_points_deg[i], format_type="1")}'
+            output += f"<g transform='translate({fmt(deg_x)},{fmt(deg_y)})'>"
+            output += f"<text transform='rotate({rotate})' text-anchor='{textanchor}"
+            output += f"' style='fill: {available_planets_setting[i]['color']}; font-size: 10px;'>{convert_decimal_to_degree_string(t_points_deg[i], format_type='1')}"
             output += "</text></g>"
 
         # check transit
-        if chart_type == "Transit" or chart_type == "Synastry":
+        if chart_type in _DOUBLE_CHART_TYPES:
             dropin = 36
         else:
             dropin = 0
@@ -390,10 +396,10 @@ def draw_planets(
         x2 = sliceToX(0, (radius - (dropin - 3)), offset) + (dropin - 3)
         y2 = sliceToY(0, (radius - (dropin - 3)), offset) + (dropin - 3)
 
-        output += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {available_planets_setting[i]["color"]}; stroke-width: 2px; stroke-opacity:.6;"/>'
+        output += f"<line x1='{fmt(x1)}' y1='{fmt(y1)}' x2='{fmt(x2)}' y2='{fmt(y2)}' style='stroke: {available_planets_setting[i]['color']}; stroke-width: 2px; stroke-opacity:.6;'/>"
 
         # check transit
-        if chart_type == "Transit" or chart_type == "Synastry":
+        if chart_type in _DOUBLE_CHART_TYPES:
             dropin = 160
         else:
             dropin = 120
@@ -402,6 +408,6 @@ def draw_planets(
         y1 = sliceToY(0, radius - dropin, offset) + dropin
         x2 = sliceToX(0, (radius - (dropin - 3)), offset) + (dropin - 3)
         y2 = sliceToY(0, (radius - (dropin - 3)), offset) + (dropin - 3)
-        output += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {available_planets_setting[i]["color"]}; stroke-width: 2px; stroke-opacity:.6;"/>'
+        output += f"<line x1='{fmt(x1)}' y1='{fmt(y1)}' x2='{fmt(x2)}' y2='{fmt(y2)}' style='stroke: {available_planets_setting[i]['color']}; stroke-width: 2px; stroke-opacity:.6;'/>"
 
     return output
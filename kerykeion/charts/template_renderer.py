@@ -1,108 +1,141 @@
 from __future__ import annotations
 
+import logging
+import re
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 
-from scour.scour import scourString
-
-from kerykeion.charts.charts_utils import draw_transit_aspect_grid, draw_aspect_grid
 from kerykeion.utilities import inline_css_variables_in_svg
 
 
-class ChartTemplateRenderer:
+# The $identifier placeholders of string.Template, used by the XML templates
+_PLACEHOLDER_RE = re.compile(rf"\$({Template.idpattern})", re.IGNORECASE)
+
+
+class _SplitTemplate:
     """
-    Handles SVG template rendering and output for KerykeionChartSVG.
+    An SVG template split once at its $identifier placeholders, so that a substitution
+    only joins the literal parts with the values instead of scanning the whole XML again.
     """
 
-    def __init__(self, chart_svg: "KerykeionChartSVG"):
-        self.chart_svg = chart_svg
+    __slots__ = ("_literals", "_keys")
 
-    def makeTemplate(self, minify: bool = False, remove_css_variables = False) -> str:
-        td = self.chart_svg._create_template_dictionary()
+    def __init__(self, template: str):
+        parts = _PLACEHOLDER_RE.split(template)
+        self._literals = parts[0::2]
+        self._keys = parts[1::2]
 
-        DATA_DIR = Path(__file__).parent
-        xml_svg = DATA_DIR / "templates" / "chart.xml"
+    def substitute(self, mapping) -> str:
+        """Same result as string.Template(template).substitute(mapping)."""
+        literals = self._literals
+        chunks = [literals[0]]
+        for key, literal in zip(self._keys, literals[1:]):
+            chunks.append(str(mapping[key]))
+            chunks.append(literal)
 
-        with open(xml_svg, "r", encoding="utf-8", errors="ignore") as f:
-            template = Template(f.read()).substitute(td)
+        return "".join(chunks)
 
-        if remove_css_variables:
-            template = inline_css_variables_in_svg(template)
 
-        if minify:
-            template = scourString(template).replace('"', "'").replace("\n", "").replace("\t","").replace("    ", "").replace("  ", "")
-        else:
-            template = template.replace('"', "'")
+@lru_cache(maxsize=None)
+def _load_template(template_name: str) -> _SplitTemplate:
+    """Read and split an SVG template of the templates folder, once per template."""
+    template_path = Path(__file__).parent / "templates" / template_name
+    return _SplitTemplate(template_path.read_bytes().decode("utf-8", "ignore"))
 
-        return template
 
-    def makeSVG(self, minify: bool = False, remove_css_variables = False):
-        template = self.makeTemplate(minify, remove_css_variables)
-        chartname = self.chart_svg.output_directory / f"{self.chart_svg.user.name} - {self.chart_svg.chart_type} Chart.svg"
-        with open(chartname, "w", encoding="utf-8", errors="ignore") as output_file:
-            output_file.write(template)
-        print(f"SVG Generated Correctly in: {chartname}")
+# Double quotes and whitespace runs, the only targets of the minify post-processing
+_MINIFY_RE = re.compile(r'"|[ \t\n]+')
 
-    def makeWheelOnlyTemplate(self, minify: bool = False, remove_css_variables = False):
-        with open(Path(__file__).parent / "templates" / "wheel_only.xml", "r", encoding="utf-8", errors="ignore") as f:
-            template = f.read()
 
-        template_dict = self.chart_svg._create_template_dictionary()
-        template = Template(template).substitute(template_dict)
+def _minify_post(svg: str) -> str:
+    """
+    Swap double quotes for single ones and squeeze whitespace in one pass over the scoured SVG.
+
+    Same result as dropping newlines and tabs, then every four and two spaces: a whitespace
+    run collapses to a single space when it holds an odd number of spaces, otherwise it goes.
+    """
+    return _MINIFY_RE.sub(lambda m: "'" if m.group(0) == '"' else " " * (m.group(0).count(" ") % 2), svg)
+
+
+def _scour_minify(svg: str) -> str:
+    """Minify a rendered SVG with scour, imported here so that renders without minify never load it."""
+    from scour.scour import scourString
+
+    return _minify_post(scourString(svg))
+
+
+# Whitespace between tags, any other whitespace run and double quotes
+_FAST_MINIFY_RE = re.compile(r'>\s+<|\s+|"')
+
+
+def _fast_minify(svg: str) -> str:
+    """
+    Minify a rendered SVG without scour: drop whitespace between tags, collapse any other
+    whitespace run to one space and swap double quotes for single ones.
+    """
+    return _FAST_MINIFY_RE.sub(
+        lambda m: "'" if m.group(0) == '"' else "><" if m.group(0)[0] == ">" else " ",
+        svg,
+    ).strip()
+
+
+class ChartTemplateRenderer:
+    """
+    Handles SVG template rendering and output for KerykeionChartSVG.
+    """
+
+    __slots__ = ("chart_svg",)
+
+    def __init__(self, chart_svg: "KerykeionChartSVG"):
+        self.chart_svg = chart_svg
 
+    def _write_svg(self, template: str, suffix: str) -> None:
+        """Write a rendered SVG to the output directory, as "<name> - <chart type> Chart<suffix>.svg"."""
+        chartname = self.chart_svg.output_directory / f"{self.chart_svg.user.name} - {self.chart_svg.chart_type} Chart{suffix}.svg"
+        Path(chartname).write_bytes(template.encode("utf-8", "ignore"))
+        logging.info(f"SVG Generated Correctly in: {chartname}")
+
+    @staticmethod
+    def _post_process(template: str, minify: bool, remove_css_variables: bool, use_scour: bool) -> str:
+        """Inline the CSS variables, then minify the rendered SVG or swap the double quotes left by names or settings."""
         if remove_css_variables:
             template = inline_css_variables_in_svg(template)
 
         if minify:
-            template = scourString(template).replace('"', "'").replace("\n", "").replace("\t","").replace("    ", "").replace("  ", "")
-        else:
-            template = template.replace('"', "'")
+            return _scour_minify(template) if use_scour else _fast_minify(template)
+
+        if '"' in template:
+            return template.replace('"', "'")
 
         return template
 
-    def makeWheelOnlySVG(self, minify: bool = False, remove_css_variables = False):
-        template = self.makeWheelOnlyTemplate(minify, remove_css_variables)
-        chartname = self.chart_svg.output_directory / f"{self.chart_svg.user.name} - {self.chart_svg.chart_type} Chart - Wheel Only.svg"
-        with open(chartname, "w", encoding="utf-8", errors="ignore") as output_file:
-            output_file.write(template)
-        print(f"SVG Generated Correctly in: {chartname}")
+    def makeTemplate(self, minify: bool = False, remove_css_variables = False, use_scour: bool = True) -> str:
+        td = self.chart_svg._create_template_dictionary()
+        template = _load_template("chart.xml").substitute(td)
+
+        return self._post_process(template, minify, remove_css_variables, use_scour)
 
-    def makeAspectGridOnlyTemplate(self, minify: bool = False, remove_css_variables = False):
-        with open(Path(__file__).parent / "templates" / "aspect_grid_only.xml", "r", encoding="utf-8", errors="ignore") as f:
-            template = f.read()
+    def makeSVG(self, minify: bool = False, remove_css_variables = False, use_scour: bool = True):
+        self._write_svg(self.makeTemplate(minify, remove_css_variables, use_scour), "")
 
+    def makeWheelOnlyTemplate(self, minify: bool = False, remove_css_variables = False, use_scour: bool = True):
         template_dict = self.chart_svg._create_template_dictionary()
+        template = _load_template("wheel_only.xml").substitute(template_dict)
 
-        if self.chart_svg.chart_type in ["Transit", "Synastry"]:
-            aspects_grid = draw_transit_aspect_grid(
-                self.chart_svg.chart_colors_settings['paper_0'],
-                self.chart_svg.available_planets_setting,
-                self.chart_svg.aspects_list
-            )
-        else:
-            aspects_grid = draw_aspect_grid(
-                self.chart_svg.chart_colors_settings['paper_0'],
-                self.chart_svg.available_planets_setting,
-                self.chart_svg.aspects_list,
-                x_start=50,
-                y_start=250
-            )
-
-        template = Template(template).substitute({**template_dict, "makeAspectGrid": aspects_grid})
+        return self._post_process(template, minify, remove_css_variables, use_scour)
 
-        if remove_css_variables:
-            template = inline_css_variables_in_svg(template)
+    def makeWheelOnlySVG(self, minify: bool = False, remove_css_variables = False, use_scour: bool = True):
+        self._write_svg(self.makeWheelOnlyTemplate(minify, remove_css_variables, use_scour), " - Wheel Only")
 
-        if minify:
-            template = scourString(template).replace('"', "'").replace("\n", "").replace("\t","").replace("    ", "").replace("  ", "")
-        else:
-            template = template.replace('"', "'")
+    def makeAspectGridOnlyTemplate(self, minify: bool = False, remove_css_variables = False, use_scour: bool = True):
+        template_dict = self.chart_svg._create_template_dictionary()
 
-        return template
+        aspects_grid = self.chart_svg._aspect_grid_renderer()
+
+        template = _load_template("aspect_grid_only.xml").substitute({**template_dict, "makeAspectGrid": aspects_grid})
+
+        return self._post_process(template, minify, remove_css_variables, use_scour)
 
-    def makeAspectGridOnlySVG(self, minify: bool = False, remove_css_variables = False):
-        template = self.makeAspectGridOnlyTemplate(minify, remove_css_variables)
-        chartname = self.chart_svg.output_directory / f"{self.chart_svg.user.name} - {self.chart_svg.chart_type} Chart - Aspect Grid Only.svg"
-        with open(chartname, "w", encoding="utf-8", errors="ignore") as output_file:
-            output_file.write(template)
-        print(f"SVG Generated Correctly in: {chartname}")
+    def makeAspectGridOnlySVG(self, minify: bool = False, remove_css_variables = False, use_scour: bool = True):
+        self._write_svg(self.makeAspectGridOnlyTemplate(minify, remove_css_variables, use_scour), " - Aspect Grid Only")
@@ -160,6 +160,11 @@ class AstrologicalSubjectModel(SubscriptableBaseModel):
     lunar_phase: LunarPhaseModel
     """Lunar phase model"""
 
+    @property
+    def formatted_local_datetime(self) -> str:
+        """Local date and time as "YYYY-MM-DD HH:MM", built from the date fields without parsing the ISO string."""
+        return f"{self.year:04d}-{self.month:02d}-{self.day:02d} {self.hour:02d}:{self.minute:02d}"
+
 
 class EphemerisDictModel(SubscriptableBaseModel):
     date: str
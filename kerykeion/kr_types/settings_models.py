@@ -4,8 +4,8 @@
 """
 
 
-from pydantic import Field
-from typing import List, Optional, Union
+from pydantic import Field, PrivateAttr
+from typing import Any, FrozenSet, List, Optional, Union
 from kerykeion.kr_types.kr_models import SubscriptableBaseModel
 
 
@@ -22,6 +22,23 @@ class KerykeionSettingsCelestialPointModel(SubscriptableBaseModel):
     label: str = Field(title="Celestial Point Label", description="The name of the celestial point in the chart, it can be different from the name")
     is_active: Optional[bool] = Field(title="Celestial Point is Active", description="Indicates if the celestial point is active in the chart", default=None)
 
+    _related_zodiac_signs_set: FrozenSet[int] = PrivateAttr(default=frozenset())
+    _name_lower: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        self._related_zodiac_signs_set = frozenset(self.related_zodiac_signs)
+        self._name_lower = self.name.lower()
+
+    @property
+    def name_lower(self) -> str:
+        """The lowercased name, as used for the subject attributes (e.g. "mean_node")."""
+        return self._name_lower
+
+    @property
+    def related_zodiac_signs_set(self) -> FrozenSet[int]:
+        """The related zodiac signs as a set, built once when the settings are loaded."""
+        return self._related_zodiac_signs_set
+
 
 # Chart Colors Settings
 class KerykeionSettingsChartColorsModel(SubscriptableBaseModel):
@@ -12,7 +12,7 @@ from kerykeion.kr_types import KerykeionSettingsModel
 import functools
 
 
-def get_settings(new_settings_file: Union[Path, None, KerykeionSettingsModel, dict] = None) -> KerykeionSettingsModel:
+def get_settings(new_settings_file: Union[Path, str, None, KerykeionSettingsModel, dict] = None) -> KerykeionSettingsModel:
     """
     This function is used to get the settings dict from the settings file.
     If no settings file is passed as argument, or the file is not found, it will fallback to:
@@ -20,7 +20,8 @@ def get_settings(new_settings_file: Union[Path, None, KerykeionSettingsModel, di
     - The default config file, located in the package folder
 
     Args:
-        new_settings_file (Union[Path, None], optional): The path of the settings file. Defaults to None.
+        new_settings_file (Union[Path, str, None], optional): The path of the settings file. Defaults to None.
+            Files are parsed once per resolved path and the settings are shared between callers.
 
     Returns:
         Dict: The settings dict
@@ -33,7 +34,7 @@ def get_settings(new_settings_file: Union[Path, None, KerykeionSettingsModel, di
 
     # Config path we passed as argument
     if new_settings_file is not None:
-        settings_file = new_settings_file
+        settings_file = Path(new_settings_file)
 
         if not settings_file.exists():
             raise FileNotFoundError(f"File {settings_file} does not exist")
@@ -48,9 +49,18 @@ def get_settings(new_settings_file: Union[Path, None, KerykeionSettingsModel, di
         settings_file = Path(__file__).parent / "kr.config.json"
 
     logging.debug(f"Kerykeion config file path: {settings_file}")
-    settings_dict = load_settings_file(settings_file)
 
-    return KerykeionSettingsModel(**settings_dict)
+    return _parse_settings_file(settings_file.resolve())
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_settings_file(settings_file: Path) -> KerykeionSettingsModel:
+    """
+    Load and validate a settings file once per resolved path.
+
+    The returned model is shared between all the callers using the same file.
+    """
+    return KerykeionSettingsModel(**load_settings_file(settings_file))
 
 
 def merge_settings(settings: KerykeionSettingsModel, new_settings: Dict) -> KerykeionSettingsModel:
@@ -1,9 +1,11 @@
 from kerykeion.kr_types import KerykeionPointModel, KerykeionException, ZodiacSignModel, AstrologicalSubjectModel, LunarPhaseModel
 from kerykeion.kr_types.kr_literals import LunarPhaseEmoji, LunarPhaseName, PointType, Planet, Houses, AxialCusps
-from typing import Union, get_args, TYPE_CHECKING
+from typing import Mapping, Union, get_args, TYPE_CHECKING
 import logging
 import math
 import re
+from functools import lru_cache
+from types import MappingProxyType
 
 if TYPE_CHECKING:
     from kerykeion import AstrologicalSubject
@@ -443,35 +445,14 @@ def circular_sort(degrees: list[Union[int, float]]) -> list[Union[int, float]]:
     return [reference] + sorted_remaining
 
 
-def inline_css_variables_in_svg(svg_content: str) -> str:
-    """
-    Process an SVG string to inline all CSS custom properties.
+_STYLE_TAG_PATTERN = re.compile(r"<style.*?>(.*?)</style>", re.DOTALL)
+_CSS_VARIABLE_PATTERN = re.compile(r"--([a-zA-Z0-9_-]+)\s*:\s*([^;]+);")
+_CSS_VARIABLE_USAGE_PATTERN = re.compile(r"var\(\s*(--([\w-]+))\s*(,\s*([^)]+))?\s*\)")
 
-    Args:
-        svg_content (str): The original SVG string with CSS variables
 
-    Returns:
-        str: The modified SVG with all CSS variables replaced by their values
-             and all style blocks removed
-    """
-    # Find and extract CSS custom properties from style tags
-    css_variable_map = {}
-    style_tag_pattern = re.compile(r"<style.*?>(.*?)</style>", re.DOTALL)
-    style_blocks = style_tag_pattern.findall(svg_content)
+def _replace_css_variable_references(text: str, css_variable_map: Mapping[str, str]) -> str:
+    """Replace var() references of text until none remain, falling back as inline_css_variables_in_svg does."""
 
-    # Parse all CSS custom properties from style blocks
-    for style_block in style_blocks:
-        # Match patterns like --color-primary: #ff0000;
-        css_variable_pattern = re.compile(r"--([a-zA-Z0-9_-]+)\s*:\s*([^;]+);")
-        for match in css_variable_pattern.finditer(style_block):
-            variable_name = match.group(1)
-            variable_value = match.group(2).strip()
-            css_variable_map[f"--{variable_name}"] = variable_value
-
-    # Remove all style blocks from the SVG
-    svg_without_style_blocks = style_tag_pattern.sub("", svg_content)
-
-    # Function to replace var() references with their actual values
     def replace_css_variable_reference(match):
         variable_name = match.group(1).strip()
         fallback_value = match.group(2) if match.group(2) else None
@@ -483,15 +464,48 @@ def inline_css_variables_in_svg(svg_content: str) -> str:
         else:
             return ""  # If variable not found and no fallback provided
 
-    # Pattern to match var(--name) or var(--name, fallback)
-    variable_usage_pattern = re.compile(r"var\(\s*(--([\w-]+))\s*(,\s*([^)]+))?\s*\)")
+    while _CSS_VARIABLE_USAGE_PATTERN.search(text):
+        text = _CSS_VARIABLE_USAGE_PATTERN.sub(replace_css_variable_reference, text)
+
+    return text
+
+
+@lru_cache(maxsize=32)
+def _resolved_css_variable_map(style_blocks: tuple) -> Mapping[str, str]:
+    """
+    Parse the CSS custom properties of some style blocks, with the variables their values
+    reference already replaced. Cached, since a theme always yields the same style blocks,
+    so the map is returned read-only.
+    """
+    css_variable_map = {}
+    for style_block in style_blocks:
+        # Match patterns like --color-primary: #ff0000;
+        for match in _CSS_VARIABLE_PATTERN.finditer(style_block):
+            css_variable_map[f"--{match.group(1)}"] = match.group(2).strip()
+
+    return MappingProxyType({
+        variable_name: _replace_css_variable_references(variable_value, css_variable_map)
+        for variable_name, variable_value in css_variable_map.items()
+    })
+
+
+def inline_css_variables_in_svg(svg_content: str) -> str:
+    """
+    Process an SVG string to inline all CSS custom properties.
 
-    # Repeatedly replace all var() references until none remain
-    # This handles nested variables or variables that reference other variables
-    processed_svg = svg_without_style_blocks
-    while variable_usage_pattern.search(processed_svg):
-        processed_svg = variable_usage_pattern.sub(
-            lambda m: replace_css_variable_reference(m), processed_svg
-        )
+    Args:
+        svg_content (str): The original SVG string with CSS variables
+
+    Returns:
+        str: The modified SVG with all CSS variables replaced by their values
+             and all style blocks removed
+    """
+    # CSS custom properties of the style tags, resolved once per set of style blocks (i.e. per theme)
+    css_variable_map = _resolved_css_variable_map(tuple(_STYLE_TAG_PATTERN.findall(svg_content)))
+
+    # Remove all style blocks from the SVG
+    svg_without_style_blocks = _STYLE_TAG_PATTERN.sub("", svg_content)
 
-    return processed_svg
+    # Variables referencing other variables are already resolved in the map,
+    # so a single substitution pass replaces every var() reference
+    return _replace_css_variable_references(svg_without_style_blocks, css_variable_map)
@@ -0,0 +1,121 @@
+import re
+from xml.etree import ElementTree
+
+import pytest
+from pydantic import ValidationError
+
+from kerykeion import AstrologicalSubject, KerykeionChartSVG, KerykeionException
+from kerykeion.charts.charts_inputs import ChartConfig
+from kerykeion.charts.charts_utils import _coordinate_formatter
+from kerykeion.settings.kerykeion_settings import get_settings
+
+
+class TestChartOptions:
+
+    def setup_class(self):
+        self.first_subject = AstrologicalSubject("John Lennon", 1940, 10, 9, 18, 30, "Liverpool", "GB", lng=-2.98333, lat=53.4, tz_str="Europe/London", online=False)
+        self.second_subject = AstrologicalSubject("Paul McCartney", 1942, 6, 18, 15, 30, "Liverpool", "GB", lng=-2.98333, lat=53.4, tz_str="Europe/London", online=False)
+
+    def test_batch_aspect_lines(self):
+        chart = KerykeionChartSVG(self.first_subject)
+        batched_chart = KerykeionChartSVG(self.first_subject, batch_aspect_lines=True)
+        aspect_colors = {color for _, color in batched_chart._aspects_with_colors}
+
+        svg = chart.makeTemplate()
+        batched_svg = batched_chart.makeTemplate()
+
+        assert svg.count("kr:node='Aspect'") == len(chart.aspects_list)
+        assert "kr:node='Aspect'" not in batched_svg
+        assert batched_svg.count("<path class='aspect'") == len(aspect_colors)
+        assert len(batched_svg) < len(svg)
+
+    def test_batch_aspect_lines_transit(self):
+        batched_svg = KerykeionChartSVG(self.first_subject, "Transit", self.second_subject, batch_aspect_lines=True).makeTemplate()
+
+        assert "kr:node='Aspect'" not in batched_svg
+        assert "<path class='aspect'" in batched_svg
+
+    def test_batch_aspect_lines_config(self):
+        assert ChartConfig().to_svg_kwargs()["batch_aspect_lines"] is False
+        assert ChartConfig(batch_aspect_lines=True).to_svg_kwargs()["batch_aspect_lines"] is True
+
+    def test_aspect_colors_follow_settings(self):
+        chart = KerykeionChartSVG(self.first_subject)
+        settings = get_settings().model_dump()
+        for aspect in settings["aspects"]:
+            aspect["color"] = "#123456"
+
+        chart.parse_json_settings(settings)
+
+        assert {color for _, color in chart._aspects_with_colors} == {"#123456"}
+        assert "stroke: #123456" in chart._draw_aspect_lines(240, 80)
+
+    def test_coordinate_precision(self):
+        svg = KerykeionChartSVG(self.first_subject, "Transit", self.second_subject, coordinate_precision=None).makeTemplate()
+        rounded_svg = KerykeionChartSVG(self.first_subject, "Transit", self.second_subject, coordinate_precision=1).makeTemplate()
+
+        lines = re.findall(r"<line x1='([^']*)' y1='([^']*)' x2='([^']*)' y2='([^']*)'", rounded_svg)
+        assert lines
+        assert all(re.fullmatch(r"-?\d+(\.\d)?", position) for line in lines for position in line)
+        translations = re.findall(r"translate\(([^)]*)\)", rounded_svg)
+        assert translations
+        assert not any(re.search(r"\.\d\d", translation) for translation in translations)
+        assert re.search(r"<line x1='[^']*\.\d{3}", svg)
+
+        # Scale factors and metadata keep their full precision
+        assert re.findall(r"scale\([^)]*\)", rounded_svg) == re.findall(r"scale\([^)]*\)", svg)
+        assert re.findall(r"kr:\w+='[^']*'", rounded_svg) == re.findall(r"kr:\w+='[^']*'", svg)
+
+    def test_coordinate_precision_zero(self):
+        svg = KerykeionChartSVG(self.first_subject, "Transit", self.second_subject).makeTemplate()
+        rounded_svg = KerykeionChartSVG(self.first_subject, "Transit", self.second_subject, coordinate_precision=0).makeTemplate()
+
+        lines = re.findall(r"<line x1='([^']*)' y1='([^']*)' x2='([^']*)' y2='([^']*)'", rounded_svg)
+        assert all(re.fullmatch(r"-?\d+", position) and position != "-0" for line in lines for position in line)
+        assert "scale(0.0)" not in rounded_svg
+        assert [_coordinate_formatter(0)(value) for value in (12.0, -0.004, -0.6, 7)] == ["12", "0", "-1", "7"]
+        assert _coordinate_formatter(2)(-0.004) == "0.00"
+        assert re.findall(r"scale\([^)]*\)", rounded_svg) == re.findall(r"scale\([^)]*\)", svg)
+
+    def test_negative_coordinate_precision(self):
+        with pytest.raises(KerykeionException):
+            KerykeionChartSVG(self.first_subject, coordinate_precision=-1)
+
+        with pytest.raises(ValidationError):
+            ChartConfig(coordinate_precision=-1)
+
+    def test_config_copy_svg_kwargs(self):
+        config = ChartConfig(theme="dark", coordinate_precision=2)
+        copy = config.model_copy(update={"coordinate_precision": 1, "settings_file": {"language": "IT"}})
+
+        assert config.to_svg_kwargs()["coordinate_precision"] == 2
+        assert copy.to_svg_kwargs()["coordinate_precision"] == 1
+        assert copy.to_svg_kwargs()["new_settings_file"] == {"language": "IT"}
+        assert copy.to_svg_kwargs()["theme"] == "dark"
+
+    def test_remove_css_variables_nested_theme(self):
+        chart = KerykeionChartSVG(self.first_subject, theme="dark")
+        svg = chart.makeTemplate()
+
+        # Reference: replace each var() with its raw value until none remain, theme variables reference others
+        css_variables = dict(re.findall(r"(--[\w-]+)\s*:\s*([^;]+);", "".join(re.findall(r"<style.*?>(.*?)</style>", svg, re.DOTALL))))
+        assert any("var(" in value for value in css_variables.values())
+        expected = re.sub(r"<style.*?>.*?</style>", "", svg, flags=re.DOTALL)
+        while "var(" in expected:
+            expected = re.sub(r"var\(\s*(--[\w-]+)\s*\)", lambda match: css_variables[match.group(1)].strip(), expected)
+
+        assert chart.makeTemplate(remove_css_variables=True) == expected
+
+    def test_fast_minify(self):
+        for chart in (
+            KerykeionChartSVG(self.first_subject),
+            KerykeionChartSVG(self.first_subject, "Synastry", self.second_subject, theme="dark"),
+        ):
+            for svg in (
+                chart.makeTemplate(minify=True, use_scour=False),
+                chart.makeWheelOnlyTemplate(minify=True, use_scour=False),
+                chart.makeAspectGridOnlyTemplate(minify=True, use_scour=False),
+            ):
+                ElementTree.fromstring(svg)
+                assert '"' not in svg
+                assert "\n" not in svg
@@ -0,0 +1,34 @@
+from kerykeion import AstrologicalSubject, KerykeionChartSVG
+from kerykeion.charts.charts_utils import calculate_element_points_batch
+from kerykeion.charts.builders.template_builder_factory import build_templates_batch, create_template_builder
+
+
+class TestChartsBatch:
+
+    def setup_class(self):
+        self.first_subject = AstrologicalSubject("John Lennon", 1940, 10, 9, 18, 30, "Liverpool", "GB", lng=-2.98333, lat=53.4, tz_str="Europe/London", online=False)
+        self.second_subject = AstrologicalSubject("Paul McCartney", 1942, 6, 18, 15, 30, "Liverpool", "GB", lng=-2.98333, lat=53.4, tz_str="Europe/London", online=False)
+
+    def test_build_templates_batch(self):
+        charts = [
+            KerykeionChartSVG(self.first_subject),
+            KerykeionChartSVG(self.second_subject, "Transit", self.first_subject),
+        ]
+
+        templates = build_templates_batch(charts, max_workers=1)
+
+        assert templates[0]["stringTitle"] != templates[1]["stringTitle"]
+        assert templates == [create_template_builder(chart).build_template_dictionary() for chart in charts]
+
+    def test_calculate_element_points_batch(self):
+        third_subject = AstrologicalSubject("Yoko Ono", 1933, 2, 18, 20, 30, "Tokyo", "JP", lng=139.69171, lat=35.6895, tz_str="Asia/Tokyo", online=False)
+        charts = [KerykeionChartSVG(subject) for subject in (self.first_subject, self.second_subject, third_subject)]
+
+        element_points = calculate_element_points_batch(
+            [chart.available_kerykeion_celestial_points for chart in charts],
+            charts[0].available_planets_setting,
+            KerykeionChartSVG._PLANET_IN_ZODIAC_EXTRA_POINTS,
+        )
+
+        assert element_points == [(chart.fire, chart.earth, chart.air, chart.water) for chart in charts]
+        assert len(set(element_points)) == len(charts)
@@ -0,0 +1,34 @@
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from kerykeion import AstrologicalSubject
+from kerykeion.charts.chart_adapter import create_chart_from_input
+from kerykeion.charts.charts_inputs import AnyChartInput, TransitChartInput
+
+
+class TestChartsInputs:
+
+    def setup_class(self):
+        self.first_subject = AstrologicalSubject("John Lennon", 1940, 10, 9, 18, 30, "Liverpool", "GB", lng=-2.98333, lat=53.4, tz_str="Europe/London", online=False)
+        self.second_subject = AstrologicalSubject("Paul McCartney", 1942, 6, 18, 15, 30, "Liverpool", "GB", lng=-2.98333, lat=53.4, tz_str="Europe/London", online=False)
+        self.adapter = TypeAdapter(AnyChartInput)
+
+    def test_any_chart_input_from_dict(self):
+        chart_input = self.adapter.validate_python({
+            "chart_type": "Transit",
+            "radix_subject": self.first_subject.model().model_dump(),
+            "transit_subject": self.second_subject.model().model_dump(),
+            "config": {"theme": "dark"},
+        })
+
+        assert isinstance(chart_input, TransitChartInput)
+        assert chart_input.radix_subject.name == "John Lennon"
+        assert chart_input.config.theme == "dark"
+
+        chart = create_chart_from_input(chart_input)
+        assert chart.chart_type == "Transit"
+        assert chart.t_user.name == "Paul McCartney"
+
+    def test_any_chart_input_unknown_type(self):
+        with pytest.raises(ValidationError):
+            self.adapter.validate_python({"chart_type": "Horary", "subject": self.first_subject.model().model_dump()})
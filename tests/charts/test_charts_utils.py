@@ -0,0 +1,19 @@
+from kerykeion.charts.charts_utils import calculate_element_percentages
+
+
+class TestChartsUtils:
+
+    def test_calculate_element_percentages(self):
+        for element_points in ([1, 1, 1, 0], [10, 20, 30, 40], [7, 7, 7, 7], [1, 2, 4, 8], [33.3, 12.7, 41.1, 19.9]):
+            assert sum(calculate_element_percentages(element_points)) == 100
+
+        assert calculate_element_percentages([10, 20, 30, 40]) == [10, 20, 30, 40]
+        assert calculate_element_percentages([2, 1, 1, 1]) == [40, 20, 20, 20]
+
+        # Equal remainders are served in element order
+        assert calculate_element_percentages([1, 1, 1, 0]) == [34, 33, 33, 0]
+        assert calculate_element_percentages([0, 1, 1, 1]) == [0, 34, 33, 33]
+        assert calculate_element_percentages([1, 1, 1, 1, 1, 1]) == [17, 17, 17, 17, 16, 16]
+
+    def test_calculate_element_percentages_without_points(self):
+        assert calculate_element_percentages([0, 0, 0, 0]) == [0, 0, 0, 0]
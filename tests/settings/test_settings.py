@@ -10,6 +10,10 @@ def test_file_settings():
 
     assert settings["language_settings"]['EN']['info'] == "Info"
 
+def test_file_settings_are_parsed_once():
+    assert get_settings(file_path) is get_settings(file_path.parent / ".." / "settings" / file_path.name)
+    assert get_settings(str(file_path)) is get_settings(file_path)
+
 def test_dict_settings():
 
     with open(file_path, 'r') as file:
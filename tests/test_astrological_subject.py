@@ -785,6 +785,19 @@ class TestAstrologicalSubject:
     def test_lunar_phase(self):
         assert self.subject.lunar_phase.model_dump() == self.expected_output["lunar_phase"]
 
+    def test_model(self):
+        subject = AstrologicalSubject("Johnny Depp", 1963, 6, 9, 0, 0, "Owensboro", "US", geonames_username="century.boy")
+        model = subject.model()
+
+        assert subject.model() is model
+        assert model.name == "Johnny Depp"
+
+        # Setting an attribute rebuilds the model
+        subject.name = "John Christopher Depp"
+        assert subject.model() is not model
+        assert subject.model().name == "John Christopher Depp"
+        assert model.name == "Johnny Depp"
+
 if __name__ == "__main__":
     import pytest
     import logging
@@ -1,5 +1,5 @@
 from kerykeion import KerykeionException
-from kerykeion.utilities import is_point_between
+from kerykeion.utilities import is_point_between, inline_css_variables_in_svg, _resolved_css_variable_map
 import pytest
 
 
@@ -65,4 +65,15 @@ class TestUtilities:
             
         with pytest.raises(KerykeionException) as ex: 
             is_point_between(359.9, 180, 15)
-            assert str(ex.value).startswith("The angle between start and end point is not allowed to exceed 180°")
\ No newline at end of file
+            assert str(ex.value).startswith("The angle between start and end point is not allowed to exceed 180°")
+
+    def test_inline_css_variables_in_svg(self):
+        style = ":root { --base: #111111; --paper: var(--base); --line: var( --paper ); }"
+        svg = f"<svg><style>{style}</style><rect style='fill: var(--line); stroke: var(--base);'/></svg>"
+
+        assert inline_css_variables_in_svg(svg) == "<svg><rect style='fill: #111111; stroke: #111111;'/></svg>"
+
+        css_variable_map = _resolved_css_variable_map((style,))
+        assert css_variable_map["--line"] == "#111111"
+        with pytest.raises(TypeError):
+            css_variable_map["--line"] = "#222222"